@@ -2,9 +2,8 @@
 
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import aiohttp
-import async_timeout
 
 
 from .const import (
@@ -13,8 +12,12 @@ from .const import (
     LOGIN_RESULT_INVALIDPASSWORD,
     LOGIN_RESULT_INVALIDUSER,
     LOGIN_RESULT_OK,
-    TIMEOUT,
 )
+from .fplAuth import TokenAuthManager, jwt_expiry
+from .fplCache import ResponseCache
+from .fplFetchGraph import FetchGraph
+from .fplHourlySeries import HourlySeries
+from .fplTransport import FplRequest, create_transport
 
 STATUS_CATEGORY_OPEN = "OPEN"
 
@@ -25,7 +28,8 @@ URL_LOGIN = (
 )
 
 URL_BUDGET_BILLING_GRAPH = (
-    API_HOST + "/cs/customer/v1/accountservices/resources/account/{account}/budgetBillingGraph"
+    API_HOST
+    + "/cs/customer/v1/accountservices/resources/account/{account}/budgetBillingGraph"
 )
 
 URL_RESOURCES_PROJECTED_BILL = (
@@ -36,53 +40,143 @@ URL_RESOURCES_PROJECTED_BILL = (
 
 
 URL_BUDGET_BILLING_PREMISE_DETAILS = (
-    API_HOST + "/cs/customer/v1/accountservices/resources/account/{account}/budgetBillingGraph/premiseDetails"
+    API_HOST
+    + "/cs/customer/v1/accountservices/resources/account/{account}/budgetBillingGraph/premiseDetails"
 )
 
 
+# endpoint names, used by the transport middlewares
+ENDPOINT_LOGIN = "login"
+ENDPOINT_LOGOUT = "logout"
+ENDPOINT_OPEN_ACCOUNTS = "open_accounts"
+ENDPOINT_ACCOUNT_LANDER = "account_lander"
+ENDPOINT_BUDGET_BILLING_PREMISE_DETAILS = "budget_billing_premise_details"
+ENDPOINT_BUDGET_BILLING_GRAPH = "budget_billing_graph"
+ENDPOINT_ENERGY_USAGE = "energy_usage"
+ENDPOINT_PAST_ENERGY_USAGE = "past_energy_usage"
+ENDPOINT_HOURLY_USAGE = "hourly_usage"
+ENDPOINT_APPLIANCE_USAGE = "appliance_usage"
+ENDPOINT_ACCOUNT_DETAILS = "account_details"
+
+# How long responses are reused, tiered by how often fpl updates the data.
+# Energy usage changes daily, budget billing monthly and the appliance
+# disaggregation once per bill period. The hourly usage of a day and the
+# energy usage of past bill periods are asked once, they are not cached.
+CACHE_TTL = {
+    ENDPOINT_OPEN_ACCOUNTS: timedelta(hours=6),
+    ENDPOINT_ACCOUNT_LANDER: timedelta(hours=1),
+    ENDPOINT_BUDGET_BILLING_PREMISE_DETAILS: timedelta(hours=24),
+    ENDPOINT_BUDGET_BILLING_GRAPH: timedelta(hours=24),
+    ENDPOINT_ENERGY_USAGE: timedelta(hours=1),
+    ENDPOINT_APPLIANCE_USAGE: timedelta(hours=24),
+}
+
+# Endpoints whose data belongs to a bill period, dropped when it rolls over
+BILL_PERIOD_ENDPOINTS = (
+    ENDPOINT_BUDGET_BILLING_PREMISE_DETAILS,
+    ENDPOINT_BUDGET_BILLING_GRAPH,
+    ENDPOINT_ENERGY_USAGE,
+    ENDPOINT_APPLIANCE_USAGE,
+)
+
 ENROLLED = "ENROLLED"
 NOTENROLLED = "NOTENROLLED"
 
 _LOGGER = logging.getLogger(__package__)
 
 
+def apply_jwt_token(request, auth):
+    """add the jwt token of the login to a request"""
+    jwt_token = auth.get("jwttoken")
+    if jwt_token:
+        request.headers["jwttoken"] = jwt_token
+
+
 class FplMainRegionApiClient:
     """Fpl Main Region Api Client"""
 
-    def __init__(self, username, password, loop, session) -> None:
+    def __init__(
+        self, username, password, loop, session, rate_limiter=None, metrics=None
+    ) -> None:
         self.session = session
         self.username = username
         self.password = password
         self.loop = loop
+        self._auth = TokenAuthManager(self.__authenticate)
+        self._cache = ResponseCache(CACHE_TTL)
+        self._bill_dates = {}
+        self._meter_numbers = {}
+        self._transport = create_transport(
+            session,
+            auth=self._auth,
+            apply_auth=apply_jwt_token,
+            cache=self._cache,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+        )
+
+    @property
+    def jwt_token(self):
+        """jwt token of the current login"""
+        return self._auth.get("jwttoken")
 
     async def login(self):
         """login into fpl"""
+        return await self._auth.async_login()
 
-        # login and get account information
+    async def ensure_login(self):
+        """login into fpl, reusing the current jwt token while it is valid"""
+        return await self._auth.async_ensure_login()
 
-        async with async_timeout.timeout(TIMEOUT):
-            response = await self.session.get(
+    async def __authenticate(self):
+        """login and get account information"""
+        response = await self._transport.request(
+            FplRequest(
+                "GET",
                 URL_LOGIN,
+                ENDPOINT_LOGIN,
                 auth=aiohttp.BasicAuth(self.username, self.password),
+                authenticate=False,
             )
+        )
 
         if response.status == 200:
             # Get JWT token from headers if present
+            tokens = {}
+            expires_at = None
             jwt_token = response.headers.get("jwttoken")
             if jwt_token:
-                self.jwt_token = jwt_token  # Store in a property
-            return LOGIN_RESULT_OK
+                tokens["jwttoken"] = jwt_token
+                expires_at = jwt_expiry(jwt_token)
+            return LOGIN_RESULT_OK, tokens, expires_at
 
         if response.status == 401:
-            json_data = json.loads(await response.text())
+            json_data = json.loads(response.text())
 
             if json_data["messageCode"] == LOGIN_RESULT_INVALIDUSER:
-                return LOGIN_RESULT_INVALIDUSER
+                return LOGIN_RESULT_INVALIDUSER, None, None
 
             if json_data["messageCode"] == LOGIN_RESULT_INVALIDPASSWORD:
-                return LOGIN_RESULT_INVALIDPASSWORD
+                return LOGIN_RESULT_INVALIDPASSWORD, None, None
 
-        return LOGIN_RESULT_FAILURE
+        return LOGIN_RESULT_FAILURE, None, None
+
+    async def _request_json(self, method, url, endpoint, account=None, **kwargs):
+        """Send a request and return the json body, or None when not successful"""
+        response = await self._transport.request(
+            FplRequest(method, url, endpoint, account=account, **kwargs)
+        )
+        if response.status != 200:
+            return None
+        return response.json()
+
+    def __check_bill_date(self, account, current_bill_date):
+        """drop cached bill period data when a new bill period started"""
+        previous = self._bill_dates.get(account)
+        self._bill_dates[account] = current_bill_date
+        if previous is not None and previous != current_bill_date:
+            _LOGGER.info("New bill period for %s, clearing cached data", account)
+            self._cache.invalidate(account, BILL_PERIOD_ENDPOINTS)
 
     async def get_open_accounts(self):
         """
@@ -92,14 +186,7 @@ class FplMainRegionApiClient:
         """
         result = []
         URL = API_HOST + "/cs/customer/v1/resources/header"
-        headers = {}
-        if hasattr(self, "jwt_token") and self.jwt_token:
-            headers["jwttoken"] = self.jwt_token
-
-        async with async_timeout.timeout(TIMEOUT):
-            response = await self.session.get(URL, headers=headers)
-
-        json_data = await response.json()
+        json_data = await self._request_json("GET", URL, ENDPOINT_OPEN_ACCOUNTS)
         accounts = json_data["data"]["accounts"]["data"]["data"]
 
         for account in accounts:
@@ -114,26 +201,76 @@ class FplMainRegionApiClient:
 
         URL_LOGOUT = API_HOST + "/api/resources/logout"
         try:
-            async with async_timeout.timeout(TIMEOUT):
-                await self.session.get(URL_LOGOUT)
+            await self._transport.request(
+                FplRequest("GET", URL_LOGOUT, ENDPOINT_LOGOUT, authenticate=False)
+            )
         except Exception as e:
             _LOGGER.error(e)
 
+        self._auth.clear()
+
     async def update(self, account) -> dict:
-        """Get data from resources endpoint"""
+        """
+        Get data from resources endpoint
+
+        The account lander is fetched first, the remaining endpoints only
+        depend on its premise, meter number and bill date and are fetched
+        at the same time.
+        """
+        graph = FetchGraph(f"update {account}")
+
+        async def fetch_account():
+            return await self.__get_account_lander(account)
+
+        async def fetch_bbl(account_info):
+            if not account_info["budget_bill"]:
+                return {}
+            return await self.__getBBL_async(account, account_info["data"])
+
+        async def fetch_energy_usage(account_info):
+            return await self.get_energy_usage(
+                account,
+                account_info["premise"],
+                account_info["current_bill_date"],
+                account_info["meterno"],
+            )
+
+        async def fetch_appliance_usage(account_info):
+            return await self.get_appliance_usage(account, account_info["premise"])
+
+        # the results of the required nodes are passed by node name
+        graph.add("account_info", fetch_account)
+        graph.add("bbl", fetch_bbl, requires=["account_info"])
+        graph.add("energy_usage", fetch_energy_usage, requires=["account_info"])
+        graph.add("appliance_usage", fetch_appliance_usage, requires=["account_info"])
+
+        results = await graph.execute()
+
+        data = results["account_info"]["data"]
+        data.update(results["bbl"])
+        data.update(results["energy_usage"])
+        data.update(results["appliance_usage"])
+
+        # Gets the account balance and past due status.
+        # data.update(await self.get_account_details(account))
+
+        return data
+
+    async def __get_account_lander(self, account) -> dict:
+        """Get account information from the account lander"""
         data = {}
         URL_RESOURCES_ACCOUNT = (
             API_HOST
             + "/cs/customer/v1/accountservices/resources/account/{account}/select?view=account-lander"
         )
-        headers = {}
-        if hasattr(self, "jwt_token") and self.jwt_token:
-            headers["jwttoken"] = self.jwt_token
-        async with async_timeout.timeout(TIMEOUT):
-            response = await self.session.get(
-                URL_RESOURCES_ACCOUNT.format(account=account), headers=headers
+        account_data = (
+            await self._request_json(
+                "GET",
+                URL_RESOURCES_ACCOUNT.format(account=account),
+                ENDPOINT_ACCOUNT_LANDER,
+                account,
             )
-        account_data = (await response.json())["data"]
+        )["data"]
 
         premise = account_data.get("premiseNumber").zfill(9)
         data["premise"] = premise
@@ -141,6 +278,7 @@ class FplMainRegionApiClient:
         data["meterSerialNo"] = account_data["meterSerialNo"]
         # data["meterNo"] = account_data["meterNo"]
         meterno = account_data["meterNo"]
+        self._meter_numbers[account] = meterno
 
         # currentBillDate
         currentBillDate = datetime.strptime(
@@ -153,6 +291,7 @@ class FplMainRegionApiClient:
         ).date()
 
         data["current_bill_date"] = str(currentBillDate)
+        self.__check_bill_date(account, currentBillDate)
         data["next_bill_date"] = str(nextBillDate)
 
         today = datetime.now().date()
@@ -174,25 +313,15 @@ class FplMainRegionApiClient:
             return programName in programs and programs[programName]
 
         # Budget Billing program
-        if hasProgram("BBL"):
-            data["budget_bill"] = True
-            bbl_data = await self.__getBBL_async(account, data)
-            data.update(bbl_data)
-        else:
-            data["budget_bill"] = False
-
-        energy_service_data = await self.get_energy_usage(
-            account, premise, currentBillDate, meterno
-        )
-        data.update(energy_service_data)
-
-        appliance_usage_data = await self.get_appliance_usage(account, premise)
-        data.update(appliance_usage_data)
-
-        # Gets the account balance and past due status.
-        # data.update(await self.get_account_details(account))
-
-        return data
+        data["budget_bill"] = hasProgram("BBL")
+
+        return {
+            "data": data,
+            "premise": premise,
+            "meterno": meterno,
+            "current_bill_date": currentBillDate,
+            "budget_bill": data["budget_bill"],
+        }
 
     # async def __getFromProjectedBill(self, account, premise, currentBillDate) -> dict:
     #     """get data from projected bill endpoint"""
@@ -236,58 +365,63 @@ class FplMainRegionApiClient:
         data = {}
 
         try:
-            headers = {}
-            if hasattr(self, "jwt_token") and self.jwt_token:
-                headers["jwttoken"] = self.jwt_token
-            async with async_timeout.timeout(TIMEOUT):
-                response = await self.session.get(
-                    URL_BUDGET_BILLING_PREMISE_DETAILS.format(account=account),
-                    headers=headers,
-                )
-                if response.status == 200:
-                    r = (await response.json())["data"]
-                    dataList = r["graphData"]
-
-                    # startIndex = len(dataList) - 1
-
-                    billingCharge = 0
-                    budgetBillDeferBalance = r["defAmt"]
-
-                    projectedBill = projectedBillData["projected_bill"]
-                    asOfDays = projectedBillData["as_of_days"]
-
-                    for det in dataList:
-                        billingCharge += det["actuallBillAmt"]
-
-                    calc1 = (projectedBill + billingCharge) / 12
-                    calc2 = (1 / 12) * (budgetBillDeferBalance)
-
-                    projectedBudgetBill = round(calc1 + calc2, 2)
-                    bbDailyAvg = round(projectedBudgetBill / 30, 2)
-                    bbAsOfDateAmt = round(projectedBudgetBill / 30 * asOfDays, 2)
-
-                    data["budget_billing_daily_avg"] = bbDailyAvg
-                    data["budget_billing_bill_to_date"] = bbAsOfDateAmt
-
-                    data["budget_billing_projected_bill"] = float(projectedBudgetBill)
-
-            headers = {}
-            if hasattr(self, "jwt_token") and self.jwt_token:
-                headers["jwttoken"] = self.jwt_token
-            async with async_timeout.timeout(TIMEOUT):
-                response = await self.session.get(
-                    URL_BUDGET_BILLING_GRAPH.format(account=account), headers=headers
-                )
-                if response.status == 200:
-                    r = (await response.json())["data"]
-                    data["bill_to_date"] = float(r["eleAmt"])
-                    data["defered_amount"] = float(r["defAmt"])
+            response_json = await self._request_json(
+                "GET",
+                URL_BUDGET_BILLING_PREMISE_DETAILS.format(account=account),
+                ENDPOINT_BUDGET_BILLING_PREMISE_DETAILS,
+                account,
+            )
+            if response_json is not None:
+                r = response_json["data"]
+                dataList = r["graphData"]
+
+                # startIndex = len(dataList) - 1
+
+                billingCharge = 0
+                budgetBillDeferBalance = r["defAmt"]
+
+                projectedBill = projectedBillData["projected_bill"]
+                asOfDays = projectedBillData["as_of_days"]
+
+                for det in dataList:
+                    billingCharge += det["actuallBillAmt"]
+
+                calc1 = (projectedBill + billingCharge) / 12
+                calc2 = (1 / 12) * (budgetBillDeferBalance)
+
+                projectedBudgetBill = round(calc1 + calc2, 2)
+                bbDailyAvg = round(projectedBudgetBill / 30, 2)
+                bbAsOfDateAmt = round(projectedBudgetBill / 30 * asOfDays, 2)
+
+                data["budget_billing_daily_avg"] = bbDailyAvg
+                data["budget_billing_bill_to_date"] = bbAsOfDateAmt
+
+                data["budget_billing_projected_bill"] = float(projectedBudgetBill)
+
+            response_json = await self._request_json(
+                "GET",
+                URL_BUDGET_BILLING_GRAPH.format(account=account),
+                ENDPOINT_BUDGET_BILLING_GRAPH,
+                account,
+            )
+            if response_json is not None:
+                r = response_json["data"]
+                data["bill_to_date"] = float(r["eleAmt"])
+                data["defered_amount"] = float(r["defAmt"])
         except Exception as e:
             _LOGGER.error(e)
 
         return data
 
-    async def get_energy_usage(self, account, premise, lastBilledDate, meterno) -> dict:
+    async def get_energy_usage(
+        self,
+        account,
+        premise,
+        lastBilledDate,
+        meterno,
+        endpoint=ENDPOINT_ENERGY_USAGE,
+        background=False,
+    ) -> dict:
         _LOGGER.info("Getting energy service data")
 
         # Tested using MITM proxy and iOS app.
@@ -308,75 +442,94 @@ class FplMainRegionApiClient:
 
         data = {}
         try:
-            headers = {}
-            if hasattr(self, "jwt_token") and self.jwt_token:
-                headers["jwttoken"] = self.jwt_token
-            async with async_timeout.timeout(TIMEOUT):
-                response = await self.session.post(
-                    URL_ENERGY_SERVICE.format(account=account),
-                    json=json,
-                    headers=headers,
-                )
-                if response.status == 200:
-                    response_data = await response.json()
-                    json_data = response_data["data"]
-
-                    current_usage = json_data["CurrentUsage"]
-                    data["projectedKWH"] = int(current_usage.get("projectedKWH"))
-                    data["dailyAverageKWH"] = float(
-                        current_usage.get("dailyAverageKWH")
-                    )
-                    data["billToDate"] = float(current_usage.get("billToDate"))
-                    data["projectedBill"] = float(current_usage.get("projectedBill"))
-                    data["dailyAvg"] = float(current_usage.get("dailyAvg"))
-                    data["avgHighTemp"] = int(current_usage.get("avgHighTemp"))
-                    data["billToDateKWH"] = float(current_usage.get("billToDateKWH"))
-                    data["recMtrReading"] = int(current_usage.get("recMtrReading") or 0)
-                    data["delMtrReading"] = int(current_usage.get("delMtrReading") or 0)
-                    data["billStartDate"] = datetime.strptime(
-                        current_usage.get("billStartDate"), "%m-%d-%Y"
-                    ).date()
-                    data["billEndDate"] = datetime.strptime(
-                        current_usage.get("billEndDate"), "%m-%d-%Y"
-                    ).date()
-
-                    daily_usage = json_data["DailyUsage"]
-                    last_day_usage = daily_usage["endDate"]
-
-                    data["DailyUsage"] = {}
-                    for day_usage in daily_usage["data"]:
-                        # We want to get the last day's usage and use that as the sensor information.
-                        # Given that this sensor should reset every day to the previous day's usage.
-                        if day_usage["date"] == last_day_usage:
-                            data["DailyUsage"]["kwhActual"] = float(
-                                day_usage.get("kwhActual") or 0
-                            )
-                            data["DailyUsage"]["billingCharge"] = float(
-                                day_usage.get("billingCharge") or 0
-                            )
-                            data["DailyUsage"]["readTime"] = datetime.fromisoformat(
-                                day_usage.get("readTime")
-                            )
-                            data["DailyUsage"]["reading"] = float(
-                                day_usage.get("reading")
-                            )
-
-                            # This is most likely not going to work, as this endpoint does not give any information related to delivery metrics.
-                            # TODO: Figure out where the delivery metrics can be grabbed from.
-                            data["DailyUsage"]["netDeliveredKwh"] = float(
-                                day_usage.get("netDeliveredKwh") or 0
-                            )
-                            data["DailyUsage"]["netDeliveredReading"] = float(
-                                day_usage.get("netDeliveredReading") or 0
-                            )
+            response_data = await self._request_json(
+                "POST",
+                URL_ENERGY_SERVICE.format(account=account),
+                endpoint,
+                account,
+                json=json,
+                background=background,
+            )
+            if response_data is not None:
+                json_data = response_data["data"]
+
+                current_usage = json_data["CurrentUsage"]
+                data["projectedKWH"] = int(current_usage.get("projectedKWH"))
+                data["dailyAverageKWH"] = float(current_usage.get("dailyAverageKWH"))
+                data["billToDate"] = float(current_usage.get("billToDate"))
+                data["projectedBill"] = float(current_usage.get("projectedBill"))
+                data["dailyAvg"] = float(current_usage.get("dailyAvg"))
+                data["avgHighTemp"] = int(current_usage.get("avgHighTemp"))
+                data["billToDateKWH"] = float(current_usage.get("billToDateKWH"))
+                data["recMtrReading"] = int(current_usage.get("recMtrReading") or 0)
+                data["delMtrReading"] = int(current_usage.get("delMtrReading") or 0)
+                data["billStartDate"] = datetime.strptime(
+                    current_usage.get("billStartDate"), "%m-%d-%Y"
+                ).date()
+                data["billEndDate"] = datetime.strptime(
+                    current_usage.get("billEndDate"), "%m-%d-%Y"
+                ).date()
+
+                daily_usage = json_data["DailyUsage"]
+                last_day_usage = daily_usage["endDate"]
+
+                data["DailyUsage"] = {}
+                # every day of the bill period, published as daily statistics
+                data["DailyUsageHistory"] = []
+                for day_usage in daily_usage["data"]:
+                    if not day_usage.get("readTime"):
+                        continue
+                    day = {
+                        "kwhActual": float(day_usage.get("kwhActual") or 0),
+                        "billingCharge": float(day_usage.get("billingCharge") or 0),
+                        "readTime": datetime.fromisoformat(day_usage.get("readTime")),
+                        "reading": float(day_usage.get("reading") or 0),
+                        # This is most likely not going to work, as this endpoint does not give any information related to delivery metrics.
+                        # TODO: Figure out where the delivery metrics can be grabbed from.
+                        "netDeliveredKwh": float(day_usage.get("netDeliveredKwh") or 0),
+                        "netDeliveredReading": float(
+                            day_usage.get("netDeliveredReading") or 0
+                        ),
+                    }
+                    if day_usage.get("kwhActual") is not None:
+                        data["DailyUsageHistory"].append(day)
+
+                    # We want to get the last day's usage and use that as the sensor information.
+                    # Given that this sensor should reset every day to the previous day's usage.
+                    if day_usage["date"] == last_day_usage:
+                        data["DailyUsage"] = day
 
         except Exception as e:
             _LOGGER.error(e)
 
         return data
 
-    async def get_hourly_usage(self, account, premise, date) -> list:
-        """get data from hourly usage for a specific date"""
+    async def get_past_energy_usage(self, account, premise, lastBilledDate) -> dict:
+        """
+        get the energy usage of the bill period billed on lastBilledDate
+
+        The meter number comes from the last update of the account, an empty
+        dict is returned before it is known.
+        """
+        meterno = self._meter_numbers.get(account)
+        if meterno is None:
+            return {}
+        return await self.get_energy_usage(
+            account,
+            premise,
+            lastBilledDate,
+            meterno,
+            ENDPOINT_PAST_ENERGY_USAGE,
+            background=True,
+        )
+
+    async def get_hourly_usage(self, account, premise, date) -> HourlySeries | None:
+        """
+        get data from hourly usage for a specific date
+
+        Returns None when the data could not be fetched, an empty series when
+        fpl has no data for the date.
+        """
         _LOGGER.info("Getting hourly usage data")
 
         URL_APPLIANCE_USAGE = (
@@ -386,40 +539,24 @@ class FplMainRegionApiClient:
 
         JSON = {"premiseNumber": premise, "startDate": date.strftime("%m-%d-%Y")}
 
-        data = []
         try:
-            headers = {}
-            if hasattr(self, "jwt_token") and self.jwt_token:
-                headers["jwttoken"] = self.jwt_token
-            async with async_timeout.timeout(TIMEOUT):
-                response = await self.session.post(
-                    URL_APPLIANCE_USAGE,
-                    json=JSON,
-                    headers=headers,
-                )
-                if response.status == 200:
-                    response_json = await response.json()
-                    json_data = response_json["data"]
-
-                    hourly_usage = json_data["HourlyUsage"]["data"]
-
-                    for hour_usage in hourly_usage:
-                        read_time = datetime.fromisoformat(hour_usage["readTime"])
-                        data.append(
-                            {
-                                "hour": hour_usage.get(
-                                    "hour"
-                                ),  # 1 - 24 (Where 1 = from 12AM to 1AM)
-                                "readTime": read_time,  # This is the end of the hour, for example 1AM.
-                                "billingCharged": hour_usage.get("billingCharged"),
-                                "kwhActual": hour_usage["kwhActual"],
-                                "reading": hour_usage["reading"],
-                            }
-                        )
+            response_json = await self._request_json(
+                "POST",
+                URL_APPLIANCE_USAGE,
+                ENDPOINT_HOURLY_USAGE,
+                account,
+                json=JSON,
+                background=True,
+            )
+            if response_json is None:
+                return None
+
+            json_data = response_json["data"]
+
+            return HourlySeries.from_json(json_data["HourlyUsage"]["data"])
         except Exception as e:
             _LOGGER.error(e)
-
-        return data
+            return None
 
     async def get_appliance_usage(self, account, premise) -> dict:
         """get data from appliance usage"""
@@ -434,27 +571,24 @@ class FplMainRegionApiClient:
         data = {}
 
         try:
-            headers = {}
-            if hasattr(self, "jwt_token") and self.jwt_token:
-                headers["jwttoken"] = self.jwt_token
-            async with async_timeout.timeout(TIMEOUT):
-                response = await self.session.post(
-                    URL_APPLIANCE_USAGE.format(account=account),
-                    json=JSON,
-                    headers=headers,
-                )
-                if response.status == 200:
-                    response_json = await response.json()
-                    json_data = response_json["data"]
-
-                    bill_periods = json_data["billPeriods"]
-                    if bill_periods:
-                        for bill_period in bill_periods:
-                            # We only care about the latest bill period.
-                            # It appears that 1 is the latest, with 2 being two months ago, etc.
-                            if int(bill_period["billPeriod"]) == 1:
-                                data["appliance_usage"] = bill_period
-                                break
+            response_json = await self._request_json(
+                "POST",
+                URL_APPLIANCE_USAGE.format(account=account),
+                ENDPOINT_APPLIANCE_USAGE,
+                account,
+                json=JSON,
+            )
+            if response_json is not None:
+                json_data = response_json["data"]
+
+                bill_periods = json_data["billPeriods"]
+                if bill_periods:
+                    for bill_period in bill_periods:
+                        # We only care about the latest bill period.
+                        # It appears that 1 is the latest, with 2 being two months ago, etc.
+                        if int(bill_period["billPeriod"]) == 1:
+                            data["appliance_usage"] = bill_period
+                            break
 
         except Exception as e:
             _LOGGER.error(e)
@@ -474,23 +608,20 @@ class FplMainRegionApiClient:
         )
 
         try:
-            headers = {}
-            if hasattr(self, "jwt_token") and self.jwt_token:
-                headers["jwttoken"] = self.jwt_token
-            async with async_timeout.timeout(TIMEOUT):
-                response = await self.session.get(ACCOUNTS_URL, headers=headers)
-                if response.status == 200:
-                    json_data = await response.json()
-                    data = json_data["data"]
-
-                    for account in data["data"]:
-                        if account["accountNumber"] == account_number:
-                            return account
-
-                    data["balance"] = float(account["balance"])
-                    data["pastDue"] = bool(account["pastDue"])
-                    # There a more fields available in the response, but none that seem to be useful.
-                    # For example, deposit, statusCategory (ex, OPEN, CLOSED), and property address.
+            json_data = await self._request_json(
+                "GET", ACCOUNTS_URL, ENDPOINT_ACCOUNT_DETAILS, account_number
+            )
+            if json_data is not None:
+                data = json_data["data"]
+
+                for account in data["data"]:
+                    if account["accountNumber"] == account_number:
+                        return account
+
+                data["balance"] = float(account["balance"])
+                data["pastDue"] = bool(account["pastDue"])
+                # There a more fields available in the response, but none that seem to be useful.
+                # For example, deposit, statusCategory (ex, OPEN, CLOSED), and property address.
 
         except Exception as e:
             _LOGGER.error(e)
@@ -2,98 +2,186 @@
 
 from datetime import datetime
 import logging
-import async_timeout
-import boto3
+import time
 
-from .const import TIMEOUT, API_HOST
+from .const import API_HOST
 from .aws_srp import AWSSRP
-from .const import LOGIN_RESULT_OK
+from .const import LOGIN_RESULT_FAILURE, LOGIN_RESULT_OK
+from .exceptions import CognitoException
+from .fplAuth import TokenAuthManager
+from .fplTransport import FplRequest, create_transport
 
 USER_POOL_ID = "us-east-1_w09KCowou"
 CLIENT_ID = "4k78t7970hhdgtafurk158dr3a"
+URL_COGNITO = "https://cognito-idp.us-east-1.amazonaws.com/"
+
+# cognito tokens are valid for one hour unless told otherwise
+DEFAULT_TOKEN_EXPIRES_IN = 3600
 
 ACCOUNT_STATUS_ACTIVE = "ACT"
 
+# endpoint names, used by the transport middlewares
+ENDPOINT_COGNITO_LOGIN = "cognito_login"
+ENDPOINT_COGNITO_REFRESH = "cognito_refresh"
+ENDPOINT_ACCOUNTS_LIST = "accounts_list"
+ENDPOINT_ACCOUNT_SUMMARY = "account_summary"
+
 _LOGGER = logging.getLogger(__package__)
 
 
+def apply_id_token(request, auth):
+    """add the cognito id token of the login to a request"""
+    request.headers["Authorization"] = f"Bearer {auth.get('id_token')}"
+
+
 class FplNorthwestRegionApiClient:
     """FPL Northwest Api client"""
 
-    def __init__(self, username, password, loop, session) -> None:
+    def __init__(
+        self,
+        username,
+        password,
+        loop,
+        session,
+        token_store=None,
+        rate_limiter=None,
+        metrics=None,
+    ) -> None:
         self.session = session
         self.username = username
         self.password = password
         self.loop = loop
-        self.id_token = None
-        self.access_token = None
-        self.refresh_token = None
+        self._auth = TokenAuthManager(
+            self.__authenticate, refresh=self.__refresh, store=token_store
+        )
+        self._transport = create_transport(
+            session,
+            auth=self._auth,
+            apply_auth=apply_id_token,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+        )
+
+    @property
+    def id_token(self):
+        """cognito id token"""
+        return self._auth.get("id_token")
+
+    @property
+    def access_token(self):
+        """cognito access token"""
+        return self._auth.get("access_token")
+
+    @property
+    def refresh_token(self):
+        """cognito refresh token"""
+        return self._auth.get("refresh_token")
 
     async def login(self):
         """login using aws"""
-        client = await self.loop.run_in_executor(
-            None, boto3.client, "cognito-idp", "us-east-1"
+        return await self._auth.async_login()
+
+    async def ensure_login(self):
+        """
+        login using the cached tokens
+
+        Expired tokens are renewed with the refresh token, the full SRP
+        login only runs when the refresh token is rejected.
+        """
+        return await self._auth.async_ensure_login()
+
+    async def __cognito(self, action, payload, endpoint):
+        """call an action of the cognito identity provider api"""
+        headers = {
+            "Content-Type": "application/x-amz-json-1.1",
+            "X-Amz-Target": f"AWSCognitoIdentityProviderService.{action}",
+        }
+
+        return await self._transport.request(
+            FplRequest(
+                "POST",
+                URL_COGNITO,
+                endpoint,
+                headers=headers,
+                json=payload,
+                authenticate=False,
+            )
         )
 
+    async def __send_login(self, action, payload):
+        """send a call of the SRP login, raising the errors of cognito"""
+        response = await self.__cognito(action, payload, ENDPOINT_COGNITO_LOGIN)
+        data = response.json()
+        if response.status != 200:
+            raise CognitoException(data.get("__type"), data.get("message"))
+        return data
+
+    async def __authenticate(self):
+        """full SRP login"""
         aws = AWSSRP(
             username=self.username,
             password=self.password,
             pool_id=USER_POOL_ID,
             client_id=CLIENT_ID,
-            loop=self.loop,
-            client=client,
+            send=self.__send_login,
         )
         tokens = await aws.authenticate_user()
+        result = tokens["AuthenticationResult"]
+
+        if "AccessToken" not in result:
+            return LOGIN_RESULT_FAILURE, None, None
+
+        return (
+            LOGIN_RESULT_OK,
+            {
+                "access_token": result["AccessToken"],
+                "refresh_token": result["RefreshToken"],
+                "id_token": result["IdToken"],
+            },
+            time.time() + result.get("ExpiresIn", DEFAULT_TOKEN_EXPIRES_IN),
+        )
 
-        if "AccessToken" in tokens["AuthenticationResult"]:
-            self.access_token = tokens["AuthenticationResult"]["AccessToken"]
-            self.refresh_token = tokens["AuthenticationResult"]["RefreshToken"]
-            self.id_token = tokens["AuthenticationResult"]["IdToken"]
-            # Get User
-            headers = {
-                "Content-Type": "application/x-amz-json-1.1",
-                "X-Amz-Target": "AWSCognitoIdentityProviderService.GetUser",
-            }
-
-            JSON = {"AccessToken": self.access_token}
-
-            async with async_timeout.timeout(TIMEOUT):
-                response = await self.session.post(
-                    "https://cognito-idp.us-east-1.amazonaws.com/",
-                    headers=headers,
-                    json=JSON,
-                )
-            if response.status == 200:
-                data = await response.json(content_type="application/x-amz-json-1.1")
-
-            # InitiateAuth
-            headers = {
-                "Content-Type": "application/x-amz-json-1.1",
-                "X-Amz-Target": "AWSCognitoIdentityProviderService.InitiateAuth",
-            }
-
-            payload = {
-                "AuthFlow": "REFRESH_TOKEN_AUTH",
-                "AuthParameters": {
-                    "DEVICE_KEY": None,
-                    "REFRESH_TOKEN": self.refresh_token,
-                },
-                "ClientId": "4k78t7970hhdgtafurk158dr3a",
-            }
-
-            async with async_timeout.timeout(TIMEOUT):
-                response = await self.session.post(
-                    "https://cognito-idp.us-east-1.amazonaws.com/",
-                    headers=headers,
-                    json=payload,
-                )
-            if response.status == 200:
-                data = await response.json(content_type="application/x-amz-json-1.1")
-
-                self.access_token = data["AuthenticationResult"]["AccessToken"]
-                self.id_token = tokens["AuthenticationResult"]["IdToken"]
-
-            return LOGIN_RESULT_OK
+    async def __refresh(self, tokens):
+        """renew the tokens using REFRESH_TOKEN_AUTH"""
+        if not tokens.get("refresh_token"):
+            return None
+
+        payload = {
+            "AuthFlow": "REFRESH_TOKEN_AUTH",
+            "AuthParameters": {
+                "DEVICE_KEY": None,
+                "REFRESH_TOKEN": tokens["refresh_token"],
+            },
+            "ClientId": CLIENT_ID,
+        }
+
+        response = await self.__cognito(
+            "InitiateAuth", payload, ENDPOINT_COGNITO_REFRESH
+        )
+        if response.status != 200:
+            # cognito answers 400 NotAuthorizedException for revoked
+            # or expired refresh tokens
+            _LOGGER.debug("Refresh failed with status %s", response.status)
+            return None
+
+        data = response.json()
+
+        result = data["AuthenticationResult"]
+        return (
+            {
+                "access_token": result["AccessToken"],
+                # the refresh token is not returned again, keep the current one
+                "refresh_token": result.get("RefreshToken", tokens["refresh_token"]),
+                "id_token": result["IdToken"],
+            },
+            time.time() + result.get("ExpiresIn", DEFAULT_TOKEN_EXPIRES_IN),
+        )
+
+    async def _request(self, method, url, endpoint, **kwargs):
+        """Send a request with the id token"""
+        return await self._transport.request(
+            FplRequest(method, url, endpoint, **kwargs)
+        )
 
     async def get_open_accounts(self):
         """
@@ -103,13 +191,10 @@ class FplNorthwestRegionApiClient:
         result = []
         URL = API_HOST + "/cs/gulf/ssp/v1/profile/accounts/list"
 
-        headers = {"Authorization": f"Bearer {self.id_token}"}
-
-        async with async_timeout.timeout(TIMEOUT):
-            response = await self.session.get(URL, headers=headers)
+        response = await self._request("GET", URL, ENDPOINT_ACCOUNTS_LIST)
 
         if response.status == 200:
-            data = await response.json()
+            data = response.json()
 
             for account in data["accounts"]:
                 if account["accountStatus"] == ACCOUNT_STATUS_ACTIVE:
@@ -130,14 +215,12 @@ class FplNorthwestRegionApiClient:
             + f"/cs/gulf/ssp/v1/accountservices/account/{account}/accountSummary?balance=y"
         )
 
-        headers = {"Authorization": f"Bearer {self.id_token}"}
-        async with async_timeout.timeout(TIMEOUT):
-            response = await self.session.get(URL, headers=headers)
+        response = await self._request("GET", URL, ENDPOINT_ACCOUNT_SUMMARY)
 
         result = {}
 
         if response.status == 200:
-            data = await response.json()
+            data = response.json()
 
             accountSumary = data["accountSummary"]["accountSummaryData"]
             billAndMetterInfo = accountSumary["billAndMeterInfo"]
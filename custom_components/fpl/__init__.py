@@ -7,8 +7,8 @@ from datetime import timedelta
 from homeassistant.core import HomeAssistant
 from homeassistant.core_config import Config
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.util import Throttle
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
 
@@ -19,9 +19,15 @@ from .const import (
     NAME,
     PLATFORMS,
     STARTUP_MESSAGE,
+    STORAGE_KEY_AUTH,
+    STORAGE_VERSION,
 )
 
 from .fplDataUpdateCoordinator import FplDataUpdateCoordinator
+from .fplHourlyState import HourlyState
+from .fplRateLimiter import get_rate_limiter
+from .fplSession import async_create_session
+from .fplSnapshot import CoordinatorSnapshot
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=30)
 
@@ -38,6 +44,13 @@ def get_device_info():
     )
 
 
+def get_token_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Store keeping the login tokens of a config entry across restarts"""
+    return Store(
+        hass, STORAGE_VERSION, f"{STORAGE_KEY_AUTH}.{entry.entry_id}", private=True
+    )
+
+
 class FplData:
     """This class handle communication and stores the data."""
 
@@ -74,16 +87,38 @@ async def async_setup_entry(hass, entry):
 
     # Configure the client.
     _LOGGER.info("Configuring the client")
-    session = async_get_clientsession(hass)
-    client = FplApi(username, password, session, hass.loop)
+    session = async_create_session(hass)
+    entry.async_on_unload(session.close)
+    client = FplApi(
+        username,
+        password,
+        session,
+        hass.loop,
+        token_store=get_token_store(hass, entry),
+        rate_limiter=get_rate_limiter(hass),
+        hass=hass,
+    )
 
-    coordinator = FplDataUpdateCoordinator(hass, client=client)
-    await coordinator.async_refresh()
+    coordinator = FplDataUpdateCoordinator(hass, client=client, entry_id=entry.entry_id)
+    entry.async_on_unload(coordinator.async_cancel_prewarm)
+    entry.async_on_unload(coordinator.async_cancel_statistics)
+    # the sensors start with the data of the last run, the first refresh
+    # does not hold the startup and is skipped while the data is fresh
+    await coordinator.async_restore()
+    restored = coordinator.data is not None
+    if not restored:
+        # without a snapshot the sensors need the first refresh
+        await coordinator.async_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if restored and not coordinator.is_fresh():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+
     # Set up Fpl as config entry.
 
     entry.add_update_listener(async_reload_entry)
@@ -110,5 +145,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     if unloaded:
         hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.api.logout()
 
     return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored data of a deleted entry."""
+    await get_token_store(hass, entry).async_remove()
+    await HourlyState(hass, entry.entry_id).async_remove()
+    await CoordinatorSnapshot(hass, entry.entry_id).async_remove()
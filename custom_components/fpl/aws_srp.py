@@ -7,10 +7,6 @@ import datetime
 import hashlib
 import hmac
 import re
-import functools
-import boto3
-
-import six
 
 from .exceptions import ForceChangePasswordException
 
@@ -67,7 +63,7 @@ def pad_hex(long_int):
     :param {Long integer|String} long_int Number or string to pad.
     :return {String} Padded hex string.
     """
-    if not isinstance(long_int, six.string_types):
+    if not isinstance(long_int, str):
         hash_str = long_to_hex(long_int)
     else:
         hash_str = long_int
@@ -104,6 +100,15 @@ def calculate_u(big_a, big_b):
 
 
 class AWSSRP(object):
+    """
+    Cognito USER_SRP_AUTH login
+
+    The calls to cognito are sent by send, an async callable receiving the
+    name of the action, like InitiateAuth, and its json payload and
+    returning the json response. It raises CognitoException when cognito
+    answers with an error.
+    """
+
     NEW_PASSWORD_REQUIRED_CHALLENGE = "NEW_PASSWORD_REQUIRED"
     PASSWORD_VERIFIER_CHALLENGE = "PASSWORD_VERIFIER"
 
@@ -113,31 +118,20 @@ class AWSSRP(object):
         password,
         pool_id,
         client_id,
-        pool_region=None,
-        client=None,
+        send,
         client_secret=None,
-        loop=None,
     ):
-        if pool_region is not None and client is not None:
-            raise ValueError(
-                "pool_region and client should not both be specified "
-                "(region should be passed to the boto3 client instead)"
-            )
-
         self.username = username
         self.password = password
         self.pool_id = pool_id
         self.client_id = client_id
         self.client_secret = client_secret
-        self.client = (
-            client if client else boto3.client("cognito-idp", region_name=pool_region)
-        )
+        self.send = send
         self.big_n = hex_to_long(n_hex)
         self.g = hex_to_long(g_hex)
         self.k = hex_to_long(hex_hash("00" + n_hex + "0" + g_hex))
         self.small_a_value = self.generate_random_small_a()
         self.large_a_value = self.calculate_a()
-        self.loop = loop
 
     def generate_random_small_a(self):
         """
@@ -245,37 +239,37 @@ class AWSSRP(object):
             )
         return response
 
-    async def authenticate_user(self, client=None):
-        """authenticate user"""
-        boto_client = self.client or client
-        auth_params = self.get_auth_params()
-
-        response = await self.loop.run_in_executor(
-            None,
-            functools.partial(
-                boto_client.initiate_auth,
-                AuthFlow="USER_SRP_AUTH",
-                AuthParameters=auth_params,
-                ClientId=self.client_id,
-            ),
+    async def initiate_auth(self):
+        """start the SRP login, returns the cognito response"""
+        return await self.send(
+            "InitiateAuth",
+            {
+                "AuthFlow": "USER_SRP_AUTH",
+                "AuthParameters": self.get_auth_params(),
+                "ClientId": self.client_id,
+            },
         )
 
+    async def respond_to_auth_challenge(self, challenge_name, responses, session=None):
+        """answer a challenge of cognito, returns the cognito response"""
+        payload = {
+            "ClientId": self.client_id,
+            "ChallengeName": challenge_name,
+            "ChallengeResponses": responses,
+        }
+        if session is not None:
+            payload["Session"] = session
+        return await self.send("RespondToAuthChallenge", payload)
+
+    async def authenticate_user(self):
+        """authenticate user"""
+        response = await self.initiate_auth()
+
         if response["ChallengeName"] == self.PASSWORD_VERIFIER_CHALLENGE:
             challenge_response = self.process_challenge(response["ChallengeParameters"])
-            tokens = await self.loop.run_in_executor(
-                None,
-                functools.partial(
-                    boto_client.respond_to_auth_challenge,
-                    ClientId=self.client_id,
-                    ChallengeName=self.PASSWORD_VERIFIER_CHALLENGE,
-                    ChallengeResponses=challenge_response,
-                ),
+            tokens = await self.respond_to_auth_challenge(
+                self.PASSWORD_VERIFIER_CHALLENGE, challenge_response
             )
-            # tokens = boto_client.respond_to_auth_challenge(
-            #    ClientId=self.client_id,
-            #    ChallengeName=self.PASSWORD_VERIFIER_CHALLENGE,
-            #    ChallengeResponses=challenge_response,
-            # )
 
             if tokens.get("ChallengeName") == self.NEW_PASSWORD_REQUIRED_CHALLENGE:
                 raise ForceChangePasswordException(
@@ -288,32 +282,23 @@ class AWSSRP(object):
                 "The %s challenge is not supported" % response["ChallengeName"]
             )
 
-    def set_new_password_challenge(self, new_password, client=None):
-        boto_client = self.client or client
-        auth_params = self.get_auth_params()
-        response = boto_client.initiate_auth(
-            AuthFlow="USER_SRP_AUTH",
-            AuthParameters=auth_params,
-            ClientId=self.client_id,
-        )
+    async def set_new_password_challenge(self, new_password):
+        response = await self.initiate_auth()
         if response["ChallengeName"] == self.PASSWORD_VERIFIER_CHALLENGE:
             challenge_response = self.process_challenge(response["ChallengeParameters"])
-            tokens = boto_client.respond_to_auth_challenge(
-                ClientId=self.client_id,
-                ChallengeName=self.PASSWORD_VERIFIER_CHALLENGE,
-                ChallengeResponses=challenge_response,
+            tokens = await self.respond_to_auth_challenge(
+                self.PASSWORD_VERIFIER_CHALLENGE, challenge_response
             )
 
-            if tokens["ChallengeName"] == self.NEW_PASSWORD_REQUIRED_CHALLENGE:
+            if tokens.get("ChallengeName") == self.NEW_PASSWORD_REQUIRED_CHALLENGE:
                 challenge_response = {
-                    "USERNAME": auth_params["USERNAME"],
+                    "USERNAME": self.username,
                     "NEW_PASSWORD": new_password,
                 }
-                new_password_response = boto_client.respond_to_auth_challenge(
-                    ClientId=self.client_id,
-                    ChallengeName=self.NEW_PASSWORD_REQUIRED_CHALLENGE,
-                    Session=tokens["Session"],
-                    ChallengeResponses=challenge_response,
+                new_password_response = await self.respond_to_auth_challenge(
+                    self.NEW_PASSWORD_REQUIRED_CHALLENGE,
+                    challenge_response,
+                    session=tokens["Session"],
                 )
                 return new_password_response
             return tokens
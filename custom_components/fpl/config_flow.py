@@ -5,7 +5,6 @@ from collections import OrderedDict
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.core import callback
 
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_NAME
@@ -23,6 +22,8 @@ from .const import (
 )
 
 from .fplapi import FplApi
+from .fplRateLimiter import get_rate_limiter
+from .fplSession import async_create_session
 
 try:
     from .secrets import DEFAULT_CONF_PASSWORD, DEFAULT_CONF_USERNAME
@@ -64,19 +65,25 @@ class FplFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             password = user_input[CONF_PASSWORD]
 
             if username not in configured_instances(self.hass):
-                session = async_create_clientsession(self.hass)
-                api = FplApi(username, password, session, loop=self.hass.loop)
-                result = await api.login()
+                async with async_create_session(self.hass) as session:
+                    api = FplApi(
+                        username,
+                        password,
+                        session,
+                        loop=self.hass.loop,
+                        rate_limiter=get_rate_limiter(self.hass),
+                        hass=self.hass,
+                    )
+                    result = await api.login()
+
+                    if result == LOGIN_RESULT_OK:
+                        info = await api.get_basic_info()
+
+                        # accounts = await api.async_get_open_accounts()
+                        await api.logout()
 
                 if result == LOGIN_RESULT_OK:
-                    info = await api.get_basic_info()
-
-                    accounts = info[CONF_ACCOUNTS]
-
-                    # accounts = await api.async_get_open_accounts()
-                    await api.logout()
-
-                    user_input[CONF_ACCOUNTS] = accounts
+                    user_input[CONF_ACCOUNTS] = info[CONF_ACCOUNTS]
                     user_input[CONF_TERRITORY] = info[CONF_TERRITORY]
 
                     return self.async_create_entry(title=username, data=user_input)
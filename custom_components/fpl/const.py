@@ -1,9 +1,68 @@
 """Constants for fpl."""
 
+from datetime import timedelta
+
 #
 TIMEOUT = 5
 API_HOST = "https://www.fpl.com"
 
+# Maximum number of accounts updated at the same time
+DEFAULT_ACCOUNT_CONCURRENCY = 3
+
+# Requests per second and burst size allowed to fpl, shared by all entries.
+# Requesting too much makes Cloudflare block all of our requests.
+RATE_LIMIT_REQUESTS_PER_SECOND = 4
+RATE_LIMIT_BURST = 10
+# Budget of the background requests of the statistics import within it, so
+# a backfill never slows the poll of the sensors down.
+BACKGROUND_RATE_LIMIT_REQUESTS_PER_SECOND = 1
+BACKGROUND_RATE_LIMIT_BURST = 3
+
+# Connection pool, durations in seconds. Connections are kept alive longer
+# than the pre-warm lead so the warmed connection is used by the poll.
+CONNECTION_LIMIT_PER_HOST = 4
+DNS_CACHE_TTL = 3600
+KEEPALIVE_TIMEOUT = 90
+CONNECTION_PREWARM_LEAD = timedelta(seconds=30)
+
+# Days of hourly usage fetched at the same time during a backfill
+HOURLY_BACKFILL_CONCURRENCY = 3
+
+# The long horizon backfill walks back through the hourly history a few days
+# per update, so it never needs more than a safe request budget.
+HOURLY_USAGE_HISTORY_DAYS = 365
+HOURLY_BACKFILL_DAYS_PER_UPDATE = 3
+# Updates in a row failing on the same day after which the backfill stops
+HOURLY_BACKFILL_MAX_FAILURES = 5
+
+# Recent days fetched again by every update, fpl revises estimated readings
+HOURLY_REVISION_DAYS = 3
+
+# Missing days refilled per update, newest first
+HOURLY_GAP_FILL_DAYS_PER_UPDATE = 3
+# Days after which fpl is expected to have the hourly usage of a day
+HOURLY_USAGE_DELAY_DAYS = 2
+
+# Past bill periods of daily usage are imported one per update
+DAILY_USAGE_HISTORY_DAYS = 730
+DAILY_HISTORY_MAX_FAILURES = 5
+
+# Statistics rows sent to the recorder at once, the next chunk waits for
+# the recorder queue to drain
+STATISTICS_IMPORT_CHUNK_SIZE = 168
+
+# Retries of transient failures, delays in seconds
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8
+
+# Failed requests in a row after which an endpoint is skipped for a while
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN = timedelta(hours=1)
+
+# Seconds before expiration at which a token is no longer used
+TOKEN_EXPIRY_MARGIN = 60
+
 # Base component constants
 NAME = "FPL Integration"
 DOMAIN = "fpl"
@@ -56,6 +115,19 @@ LOGIN_RESULT_UNAUTHORIZED = "UNAUTHORIZED"
 LOGIN_RESULT_FAILURE = "FAILURE"
 
 
+# Storage
+STORAGE_VERSION = 1
+STORAGE_KEY_AUTH = f"{DOMAIN}.auth"
+STORAGE_KEY_HOURLY = f"{DOMAIN}.hourly"
+STORAGE_KEY_SNAPSHOT = f"{DOMAIN}.snapshot"
+# Age of the last data after which it is no longer served when fpl fails
+SNAPSHOT_MAX_AGE = timedelta(hours=24)
+
+
+DATA_RATE_LIMITER = "rate_limiter"
+DATA_CONNECTOR = "connector"
+
+
 CONF_TERRITORY = "territory"
 CONF_ACCOUNTS = "account"
 
@@ -9,9 +9,21 @@ class ForceChangePasswordException(WarrantException):
     """Raised when the user is forced to change their password"""
 
 
+class CognitoException(WarrantException):
+    """Raised when cognito answers a call with an error"""
+
+    def __init__(self, error_type, message) -> None:
+        super().__init__(f"{error_type}: {message}")
+        self.error_type = error_type
+
+
 class TokenVerificationException(WarrantException):
     """Raised when token verification fails."""
 
 
 class NoTerrytoryAvailableException(Exception):
     """Thrown when not possible to determine user territory"""
+
+
+class CircuitOpenException(Exception):
+    """Thrown when an endpoint is skipped because it keeps failing"""
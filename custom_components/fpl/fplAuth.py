@@ -0,0 +1,146 @@
+"""Authentication token management for fpl api clients"""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+
+from .const import LOGIN_RESULT_OK, TOKEN_EXPIRY_MARGIN
+
+_LOGGER = logging.getLogger(__package__)
+
+
+def jwt_expiry(token):
+    """
+    Returns the expiration of a jwt token as a unix timestamp
+
+    The token is not verified, None is returned if it can not be decoded
+    or has no exp claim.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+class TokenAuthManager:
+    """
+    Keeps the tokens of a login alive across update cycles
+
+    authenticate is an async callable doing a full login, it returns a
+    tuple with the login result, the tokens dict and the expiration of the
+    tokens as a unix timestamp (None when unknown).
+
+    refresh is an optional async callable receiving the current tokens, it
+    returns the renewed tokens and their expiration, or None when the
+    server rejected the refresh and a full login is needed.
+
+    store is an optional object with async_load and async_save, like a
+    Home Assistant Store, used to keep the tokens across restarts.
+    """
+
+    def __init__(
+        self,
+        authenticate,
+        refresh=None,
+        store=None,
+        expiry_margin=TOKEN_EXPIRY_MARGIN,
+    ) -> None:
+        self._authenticate = authenticate
+        self._refresh = refresh
+        self._store = store
+        self._expiry_margin = expiry_margin
+        self._lock = asyncio.Lock()
+        self._loaded = store is None
+        self.tokens = None
+        self.expires_at = None
+
+    @property
+    def is_valid(self) -> bool:
+        """Returns true if the tokens can still be used"""
+        if self.tokens is None:
+            return False
+        if self.expires_at is None:
+            return True
+        return time.time() < self.expires_at - self._expiry_margin
+
+    def get(self, key):
+        """Returns a token by name"""
+        if self.tokens is None:
+            return None
+        return self.tokens.get(key)
+
+    def clear(self):
+        """forget the tokens"""
+        self.tokens = None
+        self.expires_at = None
+
+    async def async_login(self):
+        """run a full login, replacing the current tokens"""
+        async with self._lock:
+            return await self.__async_authenticate()
+
+    async def async_ensure_login(self):
+        """login only when there are no valid tokens"""
+        async with self._lock:
+            await self.__async_load()
+            if self.is_valid:
+                return LOGIN_RESULT_OK
+            return await self.__async_renew()
+
+    async def async_reauthenticate(self, rejected_tokens):
+        """
+        login again after the server rejected rejected_tokens
+
+        Requests running at the same time share a single login, when the
+        tokens were already replaced the new ones are used.
+        """
+        async with self._lock:
+            if self.tokens is not rejected_tokens and self.is_valid:
+                return LOGIN_RESULT_OK
+            return await self.__async_renew()
+
+    async def __async_renew(self):
+        """refresh the tokens when possible, otherwise login"""
+        if self._refresh is not None and self.tokens is not None:
+            _LOGGER.debug("Refreshing tokens")
+            refreshed = await self._refresh(self.tokens)
+            if refreshed is not None:
+                self.tokens, self.expires_at = refreshed
+                await self.__async_save()
+                return LOGIN_RESULT_OK
+            _LOGGER.info("Refresh token rejected")
+
+        return await self.__async_authenticate()
+
+    async def __async_authenticate(self):
+        _LOGGER.info("Logging in")
+        result, tokens, expires_at = await self._authenticate()
+        if result == LOGIN_RESULT_OK:
+            self.tokens = tokens
+            self.expires_at = expires_at
+        else:
+            self.clear()
+        await self.__async_save()
+        return result
+
+    async def __async_load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+
+        stored = await self._store.async_load()
+        if stored and self.tokens is None:
+            self.tokens = stored.get("tokens")
+            self.expires_at = stored.get("expires_at")
+
+    async def __async_save(self):
+        if self._store is None:
+            return
+        await self._store.async_save(
+            {"tokens": self.tokens, "expires_at": self.expires_at}
+        )
@@ -0,0 +1,79 @@
+"""Hourly usage backfill"""
+
+import asyncio
+import collections
+import logging
+from datetime import timedelta
+
+from .const import HOURLY_BACKFILL_CONCURRENCY
+
+_LOGGER = logging.getLogger(__package__)
+
+
+class HourlyBackfill:
+    """
+    Fetches hourly usage for many days at the same time
+
+    At most concurrency days are in flight, the overall request rate is
+    kept by the rate limiter of the api client.
+    """
+
+    def __init__(self, api, concurrency=HOURLY_BACKFILL_CONCURRENCY) -> None:
+        self.api = api
+        self.concurrency = max(1, concurrency)
+
+    async def async_fetch_days(self, account, premise, dates) -> list:
+        """
+        Returns the hourly usage of every date, in the order of dates
+
+        Days that could not be fetched are None.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(date):
+            async with semaphore:
+                return await self.api.apiClient.get_hourly_usage(account, premise, date)
+
+        return await asyncio.gather(*[fetch(date) for date in dates])
+
+    async def async_iter_days(self, account, premise, dates):
+        """
+        Yields (date, hourly usage) for every date, in the order of dates
+
+        The next days are fetched while a day is processed, at most
+        concurrency days are held at once. Days that could not be fetched
+        are None.
+        """
+        dates = iter(dates)
+        pending = collections.deque()
+
+        def fetch_next():
+            date = next(dates, None)
+            if date is not None:
+                pending.append(
+                    (
+                        date,
+                        asyncio.ensure_future(
+                            self.api.apiClient.get_hourly_usage(account, premise, date)
+                        ),
+                    )
+                )
+
+        try:
+            for _ in range(self.concurrency):
+                fetch_next()
+            while pending:
+                date, task = pending.popleft()
+                hourly = await task
+                fetch_next()
+                yield date, hourly
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def async_iter_range(self, account, premise, start, days):
+        """Yields (date, hourly usage) of days days from start"""
+        _LOGGER.info("Backfilling %s days of hourly usage for %s", days, account)
+        dates = (start + timedelta(days=offset) for offset in range(days))
+        async for date, hourly in self.async_iter_days(account, premise, dates):
+            yield date, hourly
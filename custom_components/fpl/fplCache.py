@@ -0,0 +1,81 @@
+"""Response cache for fpl endpoints"""
+
+import logging
+import time
+
+_LOGGER = logging.getLogger(__package__)
+
+# entries kept at most, the ones expiring first are dropped beyond it
+DEFAULT_MAX_ENTRIES = 64
+
+
+class ResponseCache:
+    """
+    In memory cache of endpoint responses
+
+    Every endpoint has its own time to live, endpoints without one are not
+    cached. Entries belong to an account so they can be invalidated when
+    something changes for that account, for example a new bill period.
+
+    Expired entries are dropped whenever a value is cached, and at most
+    max_entries are kept.
+    """
+
+    def __init__(self, ttls: dict, max_entries=DEFAULT_MAX_ENTRIES) -> None:
+        self._ttls = ttls
+        self._max_entries = max_entries
+        self._entries = {}
+
+    def is_cached(self, endpoint) -> bool:
+        """Returns true if responses of the endpoint are cached"""
+        return self._ttls.get(endpoint) is not None
+
+    def get(self, endpoint, account, key):
+        """Returns the cached value or None when missing or expired"""
+        entry = self._entries.get((endpoint, account, key))
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[(endpoint, account, key)]
+            return None
+
+        _LOGGER.debug("Using cached %s response for %s", endpoint, account)
+        return value
+
+    def set(self, endpoint, account, key, value):
+        """cache a value for the ttl of the endpoint"""
+        ttl = self._ttls.get(endpoint)
+        if ttl is None:
+            return
+        now = time.monotonic()
+        self.purge(now)
+        self._entries[(endpoint, account, key)] = (now + ttl.total_seconds(), value)
+
+        if len(self._entries) > self._max_entries:
+            by_expiry = sorted(self._entries, key=lambda entry: self._entries[entry][0])
+            for cache_key in by_expiry[: len(self._entries) - self._max_entries]:
+                del self._entries[cache_key]
+
+    def purge(self, now=None):
+        """drop the expired entries"""
+        if now is None:
+            now = time.monotonic()
+        expired = [
+            cache_key
+            for cache_key, (expires_at, _) in self._entries.items()
+            if now >= expires_at
+        ]
+        for cache_key in expired:
+            del self._entries[cache_key]
+
+    def invalidate(self, account=None, endpoints=None):
+        """drop the entries of an account and/or endpoints, all when no filter"""
+        for cache_key in list(self._entries):
+            endpoint, entry_account, _ = cache_key
+            if account is not None and entry_account != account:
+                continue
+            if endpoints is not None and endpoint not in endpoints:
+                continue
+            del self._entries[cache_key]
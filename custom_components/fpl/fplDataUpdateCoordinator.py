@@ -1,8 +1,8 @@
 """Data Update Coordinator"""
 
-import asyncio
+import hashlib
 import logging
-from datetime import timedelta, datetime
+from datetime import timedelta, datetime, time
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.components.recorder.statistics import (
@@ -10,110 +10,342 @@ from homeassistant.components.recorder.statistics import (
     StatisticData,
     StatisticMetaData,
     get_last_statistics,
+    statistics_during_period,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.components import recorder
 
 from homeassistant.util import dt as dt_util
 
 from .fplapi import FplApi
-from .const import DOMAIN, CONF_ACCOUNTS
+from .fplBackfill import HourlyBackfill
+from .fplHourlySeries import HourlySeries
+from .fplHourlyState import (
+    HourlyState,
+    day_bucket,
+    day_start,
+    hour_bucket,
+    hour_start,
+)
+from .fplSnapshot import CoordinatorSnapshot
+from .fplSums import CumulativeSums
+from .const import (
+    DOMAIN,
+    CONF_ACCOUNTS,
+    CONNECTION_PREWARM_LEAD,
+    DAILY_HISTORY_MAX_FAILURES,
+    DAILY_USAGE_HISTORY_DAYS,
+    HOURLY_BACKFILL_DAYS_PER_UPDATE,
+    HOURLY_BACKFILL_MAX_FAILURES,
+    HOURLY_GAP_FILL_DAYS_PER_UPDATE,
+    HOURLY_REVISION_DAYS,
+    HOURLY_USAGE_DELAY_DAYS,
+    HOURLY_USAGE_HISTORY_DAYS,
+    SNAPSHOT_MAX_AGE,
+    STATISTICS_IMPORT_CHUNK_SIZE,
+)
 
 SCAN_INTERVAL = timedelta(seconds=1200)
 # Anything more than 15 days may cause Cloudflare to block all of our requests.
+# Requests are paced by the rate limiter shared by all entries, older days
+# are fetched a few per update by the long horizon backfill.
 HOURLY_USAGE_BACKFILL_DAYS = 15
+# Last statistics rows kept by statistic, enough to chain a day of hours
+LAST_STATISTICS_ROWS = 24
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
+def _fingerprint(hourly: HourlySeries) -> str:
+    """hash of the values published for a day of hourly usage"""
+    hourly.sort()
+    digest = hashlib.sha1()
+    for column in (
+        hourly.read_times,
+        hourly.kwh_actual,
+        hourly.billing_charged,
+        hourly.readings,
+    ):
+        digest.update(column.tobytes())
+    return digest.hexdigest()
+
+
+def _hourly_costs(hourly: HourlySeries) -> list:
+    """(start, cost) of the hours of a day of hourly usage"""
+    return [
+        (hour.start, hour.billing_charged)
+        for hour in hourly
+        if hour.billing_charged is not None
+    ]
+
+
 class FplDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
-    def __init__(self, hass: HomeAssistant, client: FplApi) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: FplApi,
+        entry_id: str,
+        prewarm_lead: timedelta | None = CONNECTION_PREWARM_LEAD,
+        import_chunk_size: int = STATISTICS_IMPORT_CHUNK_SIZE,
+    ) -> None:
         """Initialize."""
         self.api = client
         self.platforms = []
+        self._backfill = HourlyBackfill(client)
+        self._hourly_state = HourlyState(hass, entry_id)
+        # last sum rows by statistic id, newest first
+        self._last_statistics = {}
+        self._prewarm_lead = prewarm_lead
+        self._import_chunk_size = max(1, import_chunk_size)
+        self._unsub_prewarm = None
+        self._snapshot = CoordinatorSnapshot(hass, entry_id)
+        self._statistics_task = None
+        # time the data was fetched from fpl
+        self.fetched_at = None
+        # step of the statistics import running, by account
+        self.progress = {}
 
         super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=SCAN_INTERVAL)
 
-    async def _get_last_sum(self, stat_id: str, before: datetime | None = None):
+    @callback
+    def _async_schedule_prewarm(self) -> None:
+        """open the connection to fpl shortly before the next poll"""
+        self.async_cancel_prewarm()
+        if self._prewarm_lead is None or self.update_interval is None:
+            return
+
+        delay = self.update_interval - self._prewarm_lead
+        if delay.total_seconds() <= 0:
+            return
+
+        async def _async_prewarm(_now):
+            self._unsub_prewarm = None
+            await self.api.async_prewarm()
+
+        self._unsub_prewarm = async_call_later(self.hass, delay, _async_prewarm)
+
+    @callback
+    def async_cancel_prewarm(self) -> None:
+        """cancel a scheduled pre-warm"""
+        if self._unsub_prewarm is not None:
+            self._unsub_prewarm()
+            self._unsub_prewarm = None
+
+    async def _async_load_last_statistics(self, stat_ids) -> None:
+        """
+        Read the last sums of the statistics not loaded yet
+
+        All statistics are read in a single recorder job, the rows are kept
+        between updates and follow what this coordinator publishes.
+        """
+        missing = [
+            stat_id for stat_id in stat_ids if stat_id not in self._last_statistics
+        ]
+        if not missing:
+            return
+
         def _read():
-            return get_last_statistics(
-                hass=self.hass,
-                number_of_stats=24,
-                statistic_id=stat_id,
-                convert_units=False,
-                types={"sum"},
-            )
+            result = {}
+            for stat_id in missing:
+                rows = get_last_statistics(
+                    hass=self.hass,
+                    number_of_stats=LAST_STATISTICS_ROWS,
+                    statistic_id=stat_id,
+                    convert_units=False,
+                    types={"sum"},
+                )
+                result[stat_id] = [
+                    {"start": row["start"], "sum": row["sum"]}
+                    for row in rows.get(stat_id, [])
+                ]
+            return result
 
         result = await recorder.get_instance(self.hass).async_add_executor_job(_read)
+        self._last_statistics.update(result)
 
-        if rows := result.get(stat_id):
-            if before is not None:
-                for row in rows:
-                    start = dt_util.utc_from_timestamp(row["start"])
-                    if start < before:
-                        return float(row["sum"] or 0.0), start
-            else:
-                return float(rows[-1]["sum"] or 0.0), dt_util.utc_from_timestamp(
-                    rows[-1]["start"]
-                )
+    def _remember_statistics(self, stat_id: str, stats: list) -> None:
+        """merge published statistics into the last sum rows"""
+        rows = {row["start"]: row for row in self._last_statistics.get(stat_id, [])}
+        for stat in stats:
+            start = stat["start"].timestamp()
+            rows[start] = {"start": start, "sum": stat["sum"]}
+        self._last_statistics[stat_id] = sorted(
+            rows.values(), key=lambda row: row["start"], reverse=True
+        )[:LAST_STATISTICS_ROWS]
+
+    async def _get_last_sum(self, stat_id: str):
+        await self._async_load_last_statistics([stat_id])
+
+        if rows := self._last_statistics[stat_id]:
+            return float(rows[0]["sum"] or 0.0), dt_util.utc_from_timestamp(
+                rows[0]["start"]
+            )
         return 0.0, None
 
-    async def _publish_hourly_statistics(self, account: str, hourly: list) -> None:
-        stat_id_usage = f"{DOMAIN}:{account}_hourly_usage"
-        stat_id_cost = f"{DOMAIN}:{account}_hourly_cost"
+    async def _async_get_sum_before(self, stat_id: str, before: datetime) -> float:
+        """
+        Sum of the last row of a statistic starting before before
 
-        usage_sum, last_usage_start = await self._get_last_sum(
-            stat_id_usage, hourly[0].get("readTime")
-        )
-        cost_sum, last_cost_start = await self._get_last_sum(
-            stat_id_cost, hourly[0].get("readTime")
+        Read from the recorder, the cached rows only cover the latest hours.
+        The day before is searched first, then the whole history.
+        """
+
+        def _read():
+            for days in (1, DAILY_USAGE_HISTORY_DAYS):
+                rows = statistics_during_period(
+                    self.hass,
+                    before - timedelta(days=days),
+                    before,
+                    {stat_id},
+                    "hour",
+                    None,
+                    {"sum"},
+                ).get(stat_id)
+                if rows:
+                    return float(rows[-1]["sum"] or 0.0)
+            return 0.0
+
+        return await recorder.get_instance(self.hass).async_add_executor_job(_read)
+
+    async def _async_import_statistics(self, metadata, stats: list) -> None:
+        """
+        Send statistics to the recorder in chunks
+
+        Every chunk after the first waits for the recorder queue to drain, so
+        a large backfill does not hold back the writes of other integrations.
+        """
+        instance = recorder.get_instance(self.hass)
+        for index in range(0, len(stats), self._import_chunk_size):
+            if index:
+                await instance.async_block_till_done()
+            async_add_external_statistics(
+                self.hass, metadata, stats[index : index + self._import_chunk_size]
+            )
+
+    def _cost_sums(self, stat_id: str) -> CumulativeSums:
+        return CumulativeSums(
+            self._hourly_state.get_sums(stat_id), hour_bucket, hour_start
         )
 
-        cost_stats = []
-        usage_stats = []
-        for h in sorted(hourly, key=lambda x: x.get("readTime")):
-            cost = h.get("billingCharged")
-            usage = h.get("kwhActual")
-            reading = h.get("reading")
+    async def _async_publish_sums(
+        self, metadata: StatisticMetaData, sums: CumulativeSums, points: list
+    ) -> None:
+        """
+        splice (start, value) points in running sums and publish them
 
-            read_time = h.get("readTime")
-            if read_time is None:
-                continue
+        Only the rows of the changed buckets are published, the rows after
+        them are shifted with recorder adjustments.
+        """
+        stat_id = metadata["statistic_id"]
 
-            read_time = read_time.replace(minute=0, second=0, microsecond=0)
-            start = read_time - timedelta(hours=1)
+        base = 0.0
+        first = min(start for start, _ in points)
+        if sums.needs_base(first):
+            base = await self._async_get_sum_before(stat_id, first)
 
-            if cost is not None:
-                if not last_cost_start or start > last_cost_start:
-                    cost_sum += cost
-                    cost_stat = StatisticData(
-                        start=start,
-                        sum=cost_sum,
-                        state=cost,
-                    )
-                    cost_stats.append(cost_stat)
+        rows, adjustments = sums.splice(points, base)
+        self._hourly_state.save()
 
-            if usage is not None:
-                usage_stat = StatisticData(
-                    start=start,
-                    sum=reading,
-                    state=usage,
-                )
-                usage_stats.append(usage_stat)
+        instance = recorder.get_instance(self.hass)
+        for since, delta in adjustments:
+            instance.async_adjust_statistics(
+                stat_id, since, delta, metadata["unit_of_measurement"]
+            )
+            for row in self._last_statistics.get(stat_id, []):
+                if row["start"] >= since.timestamp() and row["sum"] is not None:
+                    row["sum"] += delta
+
+        if rows:
+            stats = [
+                StatisticData(start=start, sum=total, state=value)
+                for start, value, total in rows
+            ]
+            await self._async_import_statistics(metadata, stats)
+            self._remember_statistics(stat_id, stats)
+
+    async def _async_publish_cost(self, account: str, costs: list) -> None:
+        """splice the hourly costs in the running cost sum and publish them"""
+        stat_id = f"{DOMAIN}:{account}_hourly_cost"
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            source=DOMAIN,
+            name=f"FPL {account} Hourly Cost",
+            statistic_id=stat_id,
+            unit_of_measurement="USD",
+        )
+        await self._async_publish_sums(metadata, self._cost_sums(stat_id), costs)
+
+    async def _async_publish_daily_statistics(self, account: str, days: list) -> None:
+        """
+        publish the daily usage and cost of the bill period
 
-        if cost_stats:
+        The days come with the energy usage of every update, unchanged days
+        are skipped by the running sums.
+        """
+        usage = []
+        cost = []
+        for day in days:
+            # the daily read time is the midnight ending the day
+            start = day["readTime"] - timedelta(days=1)
+            usage.append((start, day["kwhActual"]))
+            cost.append((start, day["billingCharge"]))
+
+        for kind, name, unit, points in (
+            ("usage", "Daily Usage", "kWh", usage),
+            ("cost", "Daily Cost", "USD", cost),
+        ):
+            stat_id = f"{DOMAIN}:{account}_daily_{kind}"
             metadata = StatisticMetaData(
                 has_mean=False,
                 has_sum=True,
                 source=DOMAIN,
-                name=f"FPL {account} Hourly Cost",
-                statistic_id=stat_id_cost,
-                unit_of_measurement="USD",
+                name=f"FPL {account} {name}",
+                statistic_id=stat_id,
+                unit_of_measurement=unit,
             )
+            sums = CumulativeSums(
+                self._hourly_state.get_sums(stat_id), day_bucket, day_start
+            )
+            await self._async_publish_sums(metadata, sums, points)
+
+    async def _publish_hourly_statistics(
+        self, account: str, hourly: HourlySeries, revise: bool = False
+    ) -> None:
+        """
+        publish the hourly usage and cost statistics
+
+        Usage hours already published are skipped, unless revise is set.
+        The cost is spliced in its running sum, unchanged hours are skipped.
+        """
+        stat_id_usage = f"{DOMAIN}:{account}_hourly_usage"
 
-            async_add_external_statistics(self.hass, metadata, cost_stats)
+        state = self._hourly_state
+
+        costs = []
+        usage_stats = []
+        hourly.sort()
+        for hour in hourly:
+            start = hour.start
+
+            if hour.billing_charged is not None:
+                costs.append((start, hour.billing_charged))
+
+            if hour.kwh_actual is not None and (
+                revise or not state.is_hour_published(stat_id_usage, start)
+            ):
+                usage_stat = StatisticData(
+                    start=start,
+                    sum=hour.reading,
+                    state=hour.kwh_actual,
+                )
+                usage_stats.append(usage_stat)
+
+        if costs:
+            await self._async_publish_cost(account, costs)
 
         if usage_stats:
             metadata = StatisticMetaData(
@@ -125,43 +357,386 @@ class FplDataUpdateCoordinator(DataUpdateCoordinator):
                 unit_of_measurement="kWh",
             )
 
-            async_add_external_statistics(self.hass, metadata, usage_stats)
+            await self._async_import_statistics(metadata, usage_stats)
+            self._remember_statistics(stat_id_usage, usage_stats)
+            state.mark_hours_published(stat_id_usage, usage_stats)
 
         return
 
-    async def _async_update_data(self):
+    async def _async_update_hourly(self, account, premise) -> HourlySeries | None:
+        """
+        import the hourly usage statistics of an account
+
+        Returns the hourly usage of the latest day fetched, for the sensors.
+        """
+        latest = None
+        # If there is already hourly usage statistics, then only backfill the yesterday.
+        _, last_sum_start = await self._get_last_sum(
+            f"{DOMAIN}:{account}_hourly_usage",
+        )
+        if last_sum_start is not None:
+            if self._hourly_state.get_backfill_oldest(account) is None:
+                # statistics imported before the backfill kept a checkpoint,
+                # the last days are taken as published
+                start = datetime.now() - timedelta(days=HOURLY_USAGE_BACKFILL_DAYS)
+                self._hourly_state.set_backfill(account, start.date())
+                self._hourly_state.mark_published(
+                    account,
+                    [
+                        start.date() + timedelta(days=offset)
+                        for offset in range(HOURLY_USAGE_BACKFILL_DAYS)
+                    ],
+                )
+
+            # fetch the recent days again, fpl revises their readings
+            dates = [
+                datetime.combine(datetime.now().date() - timedelta(days=offset), time())
+                for offset in range(HOURLY_REVISION_DAYS, 0, -1)
+            ]
+            days = await self._backfill.async_fetch_days(account, premise, dates)
+            for date, hourly in zip(dates, days):
+                if hourly:
+                    await self._async_import_day(account, date.date(), hourly)
+                    latest = hourly
+        else:
+            # Only backfill the full amount of days if the account has no hourly usage statistics.
+            date = datetime.now() - timedelta(days=HOURLY_USAGE_BACKFILL_DAYS)
+            # the days not published, when interrupted, are refilled as gaps
+            self._hourly_state.set_backfill(account, date.date())
+
+            # every day is published as soon as it arrives
+            fetched = 0
+            async for day, hourly in self._backfill.async_iter_range(
+                account, premise, date, HOURLY_USAGE_BACKFILL_DAYS
+            ):
+                fetched += 1
+                # in steps of 10%, every change is written to the sensors
+                percent = fetched * 10 // HOURLY_USAGE_BACKFILL_DAYS * 10
+                self._set_progress(account, f"hourly backfill {percent}%")
+                if hourly:
+                    await self._publish_hourly_statistics(account, hourly)
+                    self._hourly_state.mark_published(account, [day.date()])
+                    latest = hourly
+
+        await self._async_fill_gaps(account, premise)
+        await self._async_backfill_history(account, premise)
+        return latest
+
+    async def _async_import_day(self, account, day, hourly) -> None:
+        """
+        Publish a day of hourly usage, or publish it again when fpl revised it
+
+        The day is compared with the fingerprint of its last publication.
+        When it changed, its hours are published again, the cost sums of the
+        later hours are shifted by the running cost sum.
+        """
+        state = self._hourly_state
+        fingerprint = _fingerprint(hourly)
+
+        previous = state.get_fingerprint(account, day)
+        if previous == fingerprint:
+            return
+
+        stat_id_cost = f"{DOMAIN}:{account}_hourly_cost"
+        start = hourly.first_start()
+        sums = self._cost_sums(stat_id_cost)
+        if (
+            previous is None
+            and state.is_published(account, day)
+            and not sums.has_bucket(start)
+        ):
+            # published before the running sums were kept, only record the
+            # cost so a later revision shifts by the right amount
+            base = 0.0
+            if sums.needs_base(start):
+                base = await self._async_get_sum_before(stat_id_cost, start)
+            sums.seed(_hourly_costs(hourly), base)
+        else:
+            revise = previous is not None
+            if revise:
+                _LOGGER.info("Hourly usage of %s revised for %s", day, account)
+            await self._publish_hourly_statistics(account, hourly, revise=revise)
+
+        since = datetime.now().date() - timedelta(days=HOURLY_REVISION_DAYS)
+        state.set_fingerprint(account, day, fingerprint, since)
+        state.mark_published(account, [day])
+
+    async def _async_fill_gaps(self, account, premise) -> None:
+        """
+        Refetch the days missing since the backfill checkpoint
+
+        The gaps are found with the index of published days, a few of them
+        are refilled per update, newest first.
+        """
+        oldest = self._hourly_state.get_backfill_oldest(account)
+        if oldest is None:
+            return
+
+        # the recent days are fetched by every update
+        end = (datetime.now() - timedelta(days=HOURLY_REVISION_DAYS + 1)).date()
+        missing = self._hourly_state.get_missing_days(account, oldest, end)
+        if not missing:
+            return
+
+        _LOGGER.debug("%s days of hourly usage missing for %s", len(missing), account)
+        dates = sorted(missing[:HOURLY_GAP_FILL_DAYS_PER_UPDATE])
+        days = await self._backfill.async_fetch_days(
+            account, premise, [datetime.combine(day, time()) for day in dates]
+        )
+
+        settled = (datetime.now() - timedelta(days=HOURLY_USAGE_DELAY_DAYS)).date()
+        filled = []
+        for date, day in zip(dates, days):
+            if day:
+                await self._publish_hourly_statistics(account, day)
+                filled.append(date)
+            elif day is not None and date < settled:
+                # fpl has no data for the day, do not ask again
+                filled.append(date)
+
+        if filled:
+            self._hourly_state.mark_published(account, filled)
+
+    async def _async_backfill_history(self, account, premise) -> None:
+        """
+        Walk back through the hourly history, a few days per update
+
+        The progress is kept in the hourly state so the walk resumes after a
+        restart. It stops at the first day without data or at the horizon.
+        """
+        if self._hourly_state.is_backfill_done(account):
+            return
+
+        oldest = self._hourly_state.get_backfill_oldest(account)
+        horizon = (datetime.now() - timedelta(days=HOURLY_USAGE_HISTORY_DAYS)).date()
+        dates = [
+            oldest - timedelta(days=offset)
+            for offset in range(1, HOURLY_BACKFILL_DAYS_PER_UPDATE + 1)
+            if oldest - timedelta(days=offset) >= horizon
+        ]
+        if not dates:
+            self._hourly_state.set_backfill(account, oldest, done=True)
+            return
+
+        days = await self._backfill.async_fetch_days(
+            account, premise, [datetime.combine(day, time()) for day in dates]
+        )
+
+        hourly = HourlySeries()
+        done = False
+        failed = False
+        for date, day in zip(dates, days):
+            if day is None:
+                failed = True
+                break
+            if not day:
+                _LOGGER.info("No hourly usage before %s for %s", oldest, account)
+                done = True
+                break
+            hourly.extend(day)
+            oldest = date
+
+        if hourly:
+            await self._publish_hourly_statistics(account, hourly)
+            self._hourly_state.mark_published(account, dates[: dates.index(oldest) + 1])
+
+        if failed and not hourly:
+            failures = self._hourly_state.add_backfill_failure(account)
+            if failures >= HOURLY_BACKFILL_MAX_FAILURES:
+                _LOGGER.warning(
+                    "Stopping the hourly backfill of %s at %s", account, oldest
+                )
+                self._hourly_state.set_backfill(account, oldest, done=True)
+            return
+
+        self._hourly_state.set_backfill(account, oldest, done=done or oldest <= horizon)
+
+    async def _async_backfill_daily_history(
+        self, account, premise, bill_start_date
+    ) -> None:
+        """
+        Import the daily usage of the past bill periods, one per update
+
+        A bill period is asked with the day before the start of the oldest
+        period imported as its bill date. The walk stops when fpl returns no
+        older period or at the horizon.
+        """
+        state = self._hourly_state
+        if state.is_daily_history_done(account):
+            return
+
+        oldest = state.get_daily_history_oldest(account) or bill_start_date
+        if oldest is None:
+            return
+
+        horizon = (datetime.now() - timedelta(days=DAILY_USAGE_HISTORY_DAYS)).date()
+        if oldest <= horizon:
+            state.set_daily_history(account, oldest, done=True)
+            return
+
+        usage = await self.api.apiClient.get_past_energy_usage(
+            account, premise, oldest - timedelta(days=1)
+        )
+        if not usage:
+            failures = state.add_daily_history_failure(account)
+            if failures >= DAILY_HISTORY_MAX_FAILURES:
+                _LOGGER.warning(
+                    "Stopping the daily history import of %s at %s", account, oldest
+                )
+                state.set_daily_history(account, oldest, done=True)
+            return
+
+        start = usage.get("billStartDate")
+        days = usage.get("DailyUsageHistory")
+        if not days or start is None or start >= oldest:
+            _LOGGER.info("No daily usage before %s for %s", oldest, account)
+            state.set_daily_history(account, oldest, done=True)
+            return
+
+        await self._async_publish_daily_statistics(account, days)
+        state.set_daily_history(account, start)
+
+    async def async_restore(self) -> None:
+        """restore the data of the last snapshot, before the first refresh"""
+        snapshot = await self._snapshot.async_load()
+        if snapshot is not None:
+            self.data, self.fetched_at = snapshot
+            _LOGGER.debug("Restored the data fetched at %s", self.fetched_at)
+
+    def is_fresh(self) -> bool:
+        """true when the data is not older than the update interval"""
+        return (
+            self.fetched_at is not None
+            and self.update_interval is not None
+            and dt_util.utcnow() - self.fetched_at < self.update_interval
+        )
+
+    @callback
+    def async_cancel_statistics(self) -> None:
+        """cancel a running statistics import"""
+        if self._statistics_task is not None:
+            self._statistics_task.cancel()
+            self._statistics_task = None
+
+    @callback
+    def _async_start_statistics(self, data) -> None:
+        """import the statistics in the background, one import at a time"""
+        if self._statistics_task is not None and not self._statistics_task.done():
+            _LOGGER.debug("The statistics import is still running")
+            return
+
+        self._statistics_task = self.hass.async_create_background_task(
+            self._async_update_statistics(data), f"{DOMAIN} statistics import"
+        )
+
+    def _set_progress(self, account, progress: str | None) -> None:
+        """record the progress of the statistics import of an account"""
+        if self.progress.get(account) == progress:
+            return
+        if progress is None:
+            self.progress.pop(account, None)
+        else:
+            _LOGGER.debug("Statistics import of %s: %s", account, progress)
+            self.progress[account] = progress
+        # the sensors show the progress as an attribute
+        self.async_update_listeners()
+
+    async def _async_update_statistics(self, data) -> None:
+        """import the hourly and daily statistics of the accounts"""
         try:
-            data = await self.api.async_get_data()
+            await self._hourly_state.async_load()
+
+            # the account is missing, or kept with its fetch time, when it
+            # failed to update
+            accounts = [
+                account
+                for account in data.get(CONF_ACCOUNTS, [])
+                if account in data and "fetched_at" not in data[account]
+            ]
+            await self._async_load_last_statistics(
+                [
+                    f"{DOMAIN}:{account}_{period}_{kind}"
+                    for account in accounts
+                    for period in ("hourly", "daily")
+                    for kind in ("usage", "cost")
+                ]
+            )
 
             # Backfill hourly cost for accounts
-            for account in data.get(CONF_ACCOUNTS, []):
-                premise = data.get(account, {}).get("premise")
-                # If there is already hourly usage statistics, then only backfill the yesterday.
-                _, last_sum_start = await self._get_last_sum(
-                    f"{DOMAIN}:{account}_hourly_usage",
-                )
-                if last_sum_start is not None:
-                    date = datetime.now() - timedelta(days=1)
-                    hourly = await self.api.apiClient.get_hourly_usage(
-                        account, premise, date
+            for account in accounts:
+                premise = data[account].get("premise")
+                self._set_progress(account, "hourly usage")
+                hourly = await self._async_update_hourly(account, premise)
+                if hourly is not None:
+                    data[account]["HourlyUsage"] = hourly
+
+                # the daily usage comes with the energy usage of the account
+                if days := data[account].get("DailyUsageHistory"):
+                    self._set_progress(account, "daily usage")
+                    await self._async_publish_daily_statistics(account, days)
+                    await self._async_backfill_daily_history(
+                        account, premise, data[account].get("billStartDate")
                     )
-                    await self._publish_hourly_statistics(account, hourly)
-                else:
-                    # Only backfill the full amount of days if the account has no hourly usage statistics.
-                    # We need to start backwards. For example today - 360 days.
-                    date = datetime.now() - timedelta(days=HOURLY_USAGE_BACKFILL_DAYS)
-
-                    all_hourly: list = []
-                    for _ in range(HOURLY_USAGE_BACKFILL_DAYS):
-                        hourly = await self.api.apiClient.get_hourly_usage(
-                            account, premise, date
-                        )
-                        all_hourly.extend(hourly)
-                        date = date + timedelta(days=1)
-                        await asyncio.sleep(1)
-                    if all_hourly:
-                        await self._publish_hourly_statistics(account, all_hourly)
-
-            return data
+                self._set_progress(account, None)
+
+            # a newer refresh replaced the data, its own import saves it
+            if data is self.data:
+                self._snapshot.save(data, self.fetched_at)
+                self.async_update_listeners()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Could not import the statistics")
+        finally:
+            if self.progress:
+                self.progress.clear()
+                self.async_update_listeners()
+
+    async def _async_update_data(self):
+        try:
+            data = await self.api.async_get_data()
         except Exception as exception:
+            if (
+                self.data is not None
+                and self.fetched_at is not None
+                and dt_util.utcnow() - self.fetched_at < SNAPSHOT_MAX_AGE
+            ):
+                # serve the last data until it is too old
+                _LOGGER.warning(
+                    "Could not update, keeping the data fetched at %s: %s",
+                    self.fetched_at,
+                    exception,
+                )
+                return self.data
             raise UpdateFailed() from exception
+
+        now = dt_util.utcnow()
+        previous = self.data or {}
+        for account in data.get(CONF_ACCOUNTS, []):
+            last = previous.get(account)
+            if not isinstance(last, dict):
+                continue
+            if account in data:
+                # keep the hourly usage until the statistics import replaces it
+                if "HourlyUsage" in last:
+                    data[account].setdefault("HourlyUsage", last["HourlyUsage"])
+                continue
+
+            # the account failed to update, serve its last data until it is
+            # too old, the data of the other accounts is fresh
+            fetched_at = last.get("fetched_at", self.fetched_at)
+            if fetched_at is not None and now - fetched_at < SNAPSHOT_MAX_AGE:
+                _LOGGER.warning(
+                    "Could not update %s, keeping the data fetched at %s",
+                    account,
+                    fetched_at,
+                )
+                last["fetched_at"] = fetched_at
+                data[account] = last
+
+        self.fetched_at = now
+        self._snapshot.save(data, self.fetched_at)
+        self._async_schedule_prewarm()
+
+        # hourly usage is only available for the main region
+        if self.api.isMainRegion():
+            self._async_start_statistics(data)
+        return data
@@ -58,6 +58,11 @@ class FplEntity(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self):
         """Return the state attributes."""
         attributes = {"attribution": ATTRIBUTION}
+        fetched_at = self.getData("fetched_at") or self.coordinator.fetched_at
+        if fetched_at is not None:
+            attributes["data_as_of"] = fetched_at
+        if progress := self.coordinator.progress.get(self.account):
+            attributes["statistics_import"] = progress
         attributes.update(self.customAttributes())
         return attributes
 
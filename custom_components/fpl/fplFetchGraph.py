@@ -0,0 +1,84 @@
+"""Dependency graph executor for fpl fetches"""
+
+import asyncio
+import logging
+import time
+
+_LOGGER = logging.getLogger(__package__)
+
+
+class FetchNode:
+    """A single fetch in a fetch graph"""
+
+    def __init__(self, name, func, requires=()) -> None:
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+
+
+class FetchGraph:
+    """
+    Runs fetch nodes as soon as the nodes they require are done
+
+    Every node is an async callable that receives the results of the nodes
+    it requires as keyword arguments. Nodes without a dependency between
+    them run at the same time.
+    """
+
+    def __init__(self, name="fetch") -> None:
+        self.name = name
+        self.nodes = {}
+        self.timings = {}
+
+    def add(self, name, func, requires=()):
+        """add a node, required nodes must be added first"""
+        if name in self.nodes:
+            raise ValueError(f"Fetch node {name} already exists")
+
+        for required in requires:
+            if required not in self.nodes:
+                raise ValueError(f"Fetch node {name} requires unknown node {required}")
+
+        self.nodes[name] = FetchNode(name, func, requires)
+
+    async def execute(self) -> dict:
+        """
+        Execute all nodes
+
+        Returns a dict with the result of every node. The first error raised
+        by a node is raised once all nodes are done, nodes that require a
+        failed node fail with the same error.
+        """
+        tasks = {}
+        self.timings = {}
+        started = time.monotonic()
+
+        async def run(node: FetchNode):
+            inputs = {}
+            for required in node.requires:
+                inputs[required] = await tasks[required]
+
+            start = time.monotonic()
+            try:
+                return await node.func(**inputs)
+            finally:
+                self.timings[node.name] = time.monotonic() - start
+
+        # nodes are stored in insertion order, so required tasks always exist
+        for node in self.nodes.values():
+            tasks[node.name] = asyncio.ensure_future(run(node))
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        self.timings["total"] = time.monotonic() - started
+
+        _LOGGER.debug(
+            "%s timings: %s",
+            self.name,
+            ", ".join(f"{key}={value:.3f}s" for key, value in self.timings.items()),
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+        return dict(zip(tasks.keys(), results))
@@ -0,0 +1,147 @@
+"""Compact series of hourly usage"""
+
+import math
+from array import array
+from datetime import datetime, timedelta, timezone
+
+_HOUR = timedelta(hours=1)
+
+
+def _value(value) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _optional(value: float):
+    return None if math.isnan(value) else value
+
+
+class HourlyReading:
+    """One hour of a HourlySeries"""
+
+    __slots__ = (
+        "hour",
+        "read_time",
+        "start",
+        "billing_charged",
+        "kwh_actual",
+        "reading",
+    )
+
+    def __init__(self, hour, read_time, billing_charged, kwh_actual, reading) -> None:
+        self.hour = hour  # 1 - 24 (Where 1 = from 12AM to 1AM)
+        self.read_time = read_time  # This is the end of the hour, for example 1AM.
+        self.start = read_time.replace(minute=0, second=0, microsecond=0) - _HOUR
+        self.billing_charged = billing_charged
+        self.kwh_actual = kwh_actual
+        self.reading = reading
+
+
+class HourlySeries:
+    """
+    Hourly usage stored by column
+
+    The read times are kept as epoch seconds and the values as doubles, a
+    missing value is nan. An hour takes about 33 bytes instead of a dict
+    with a datetime. Indexing and iterating return HourlyReading records
+    with utc read times.
+    """
+
+    __slots__ = ("hours", "read_times", "billing_charged", "kwh_actual", "readings")
+
+    def __init__(self) -> None:
+        self.hours = array("b")
+        self.read_times = array("q")
+        self.billing_charged = array("d")
+        self.kwh_actual = array("d")
+        self.readings = array("d")
+
+    @classmethod
+    def from_json(cls, hourly_usage) -> "HourlySeries":
+        """series of the HourlyUsage data of the fpl response"""
+        series = cls()
+        series.hours = array("b", [usage.get("hour") or 0 for usage in hourly_usage])
+        series.read_times = array(
+            "q",
+            [
+                int(datetime.fromisoformat(usage["readTime"]).timestamp())
+                for usage in hourly_usage
+            ],
+        )
+        series.billing_charged = array(
+            "d", [_value(usage.get("billingCharged")) for usage in hourly_usage]
+        )
+        series.kwh_actual = array(
+            "d", [_value(usage["kwhActual"]) for usage in hourly_usage]
+        )
+        series.readings = array(
+            "d", [_value(usage["reading"]) for usage in hourly_usage]
+        )
+        return series
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HourlySeries":
+        """inverse of as_dict"""
+        series = cls()
+        for name in cls.__slots__:
+            column = getattr(series, name)
+            column.extend(math.nan if value is None else value for value in data[name])
+        return series
+
+    def as_dict(self) -> dict:
+        """the columns as json friendly lists, nan is None"""
+        return {
+            name: [
+                None if isinstance(value, float) and math.isnan(value) else value
+                for value in getattr(self, name)
+            ]
+            for name in self.__slots__
+        }
+
+    def extend(self, other: "HourlySeries"):
+        """add the hours of another series at the end of the series"""
+        for name in self.__slots__:
+            getattr(self, name).extend(getattr(other, name))
+
+    def sort(self):
+        """sort the hours by read time"""
+        read_times = self.read_times
+        if all(a <= b for a, b in zip(read_times, read_times[1:])):
+            return
+        order = sorted(range(len(self)), key=read_times.__getitem__)
+        for name in self.__slots__:
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, (column[i] for i in order)))
+
+    def __len__(self) -> int:
+        return len(self.read_times)
+
+    def __getitem__(self, index) -> HourlyReading:
+        return HourlyReading(
+            self.hours[index],
+            datetime.fromtimestamp(self.read_times[index], timezone.utc),
+            _optional(self.billing_charged[index]),
+            _optional(self.kwh_actual[index]),
+            _optional(self.readings[index]),
+        )
+
+    def __iter__(self):
+        for hour, read_time, billing_charged, kwh_actual, reading in zip(
+            self.hours,
+            self.read_times,
+            self.billing_charged,
+            self.kwh_actual,
+            self.readings,
+        ):
+            yield HourlyReading(
+                hour,
+                datetime.fromtimestamp(read_time, timezone.utc),
+                _optional(billing_charged),
+                _optional(kwh_actual),
+                _optional(reading),
+            )
+
+    def first_start(self) -> datetime:
+        """start of the earliest hour"""
+        return datetime.fromtimestamp(
+            min(self.read_times) // 3600 * 3600 - 3600, timezone.utc
+        )
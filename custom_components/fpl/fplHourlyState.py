@@ -0,0 +1,187 @@
+"""Persisted state of the hourly statistics import"""
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import STORAGE_KEY_HOURLY, STORAGE_VERSION
+
+# delay before the state is written, so a cycle is written at once
+SAVE_DELAY = 10
+
+
+def hour_bucket(start: datetime):
+    """local day and hour since the local midnight of an hour"""
+    # a day has 25 hours when dst ends
+    midnight = dt_util.start_of_local_day(dt_util.as_local(start))
+    hour = int((dt_util.as_utc(start) - dt_util.as_utc(midnight)).total_seconds())
+    return midnight.date().isoformat(), hour // 3600
+
+
+def hour_start(day: str, hour: int) -> datetime:
+    """start of the hour of a local day, the inverse of hour_bucket"""
+    midnight = dt_util.start_of_local_day(date.fromisoformat(day))
+    return dt_util.as_utc(midnight) + timedelta(hours=hour)
+
+
+def day_bucket(start: datetime):
+    """local month and day of the month of a day"""
+    local = dt_util.as_local(start)
+    return local.strftime("%Y-%m"), local.day
+
+
+def day_start(month: str, day: int) -> datetime:
+    """start of a day of a local month, the inverse of day_bucket"""
+    first = date.fromisoformat(f"{month}-01")
+    return dt_util.as_utc(dt_util.start_of_local_day(first + timedelta(days=day - 1)))
+
+
+class HourlyState:
+    """
+    Hourly statistics import state of a config entry, by account
+
+    Keeps the checkpoint of the long horizon backfill, so it resumes
+    where it stopped after a restart, and the index of the days already
+    published, used to find the gaps without querying the recorder.
+
+    The hours published to every statistic are indexed by local day, as a
+    bitmap of the hours. The fingerprints of the recent days tell when fpl
+    revised a day, and the running sums of the cost are kept here too.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id) -> None:
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_HOURLY}.{entry_id}")
+        self._data = None
+        self._published = {}
+
+    async def async_load(self):
+        """load the state, only the first call reads the store"""
+        if self._data is None:
+            self._data = await self._store.async_load() or {}
+            self._data.setdefault("accounts", {})
+            self._data.setdefault("statistics", {})
+            self._data.setdefault("sums", {})
+
+    async def async_remove(self):
+        """remove the persisted state"""
+        self._published = {}
+        await self._store.async_remove()
+
+    def _account(self, account) -> dict:
+        return self._data["accounts"].setdefault(account, {})
+
+    def save(self):
+        """schedule writing the state"""
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    def get_backfill_oldest(self, account) -> date | None:
+        """oldest day reached by the backfill"""
+        oldest = self._account(account).get("backfill_oldest")
+        return date.fromisoformat(oldest) if oldest else None
+
+    def is_backfill_done(self, account) -> bool:
+        """true when the backfill reached the start of the history"""
+        return self._account(account).get("backfill_done", False)
+
+    def set_backfill(self, account, oldest: date, done=False):
+        """record the progress of the backfill"""
+        state = self._account(account)
+        state["backfill_oldest"] = oldest.isoformat()
+        state["backfill_done"] = done
+        state["backfill_failures"] = 0
+        self.save()
+
+    def add_backfill_failure(self, account) -> int:
+        """record a failed backfill step, returns the failures in a row"""
+        state = self._account(account)
+        state["backfill_failures"] = state.get("backfill_failures", 0) + 1
+        self.save()
+        return state["backfill_failures"]
+
+    def get_daily_history_oldest(self, account) -> date | None:
+        """start of the oldest bill period of daily usage imported"""
+        oldest = self._account(account).get("daily_history_oldest")
+        return date.fromisoformat(oldest) if oldest else None
+
+    def is_daily_history_done(self, account) -> bool:
+        """true when no older bill period is left to import"""
+        return self._account(account).get("daily_history_done", False)
+
+    def set_daily_history(self, account, oldest: date, done=False):
+        """record the progress of the bill period walk"""
+        state = self._account(account)
+        state["daily_history_oldest"] = oldest.isoformat()
+        state["daily_history_done"] = done
+        state["daily_history_failures"] = 0
+        self.save()
+
+    def add_daily_history_failure(self, account) -> int:
+        """record a failed bill period, returns the failures in a row"""
+        state = self._account(account)
+        state["daily_history_failures"] = state.get("daily_history_failures", 0) + 1
+        self.save()
+        return state["daily_history_failures"]
+
+    def _published_days(self, account) -> set:
+        if account not in self._published:
+            self._published[account] = set(
+                self._account(account).get("published_days", [])
+            )
+        return self._published[account]
+
+    def is_published(self, account, day: date) -> bool:
+        """true when the hourly usage of day was published"""
+        return day.isoformat() in self._published_days(account)
+
+    def mark_published(self, account, days):
+        """add days to the index of published days"""
+        published = self._published_days(account)
+        published.update(day.isoformat() for day in days)
+        self._account(account)["published_days"] = sorted(published)
+        self.save()
+
+    def get_missing_days(self, account, start: date, end: date) -> list:
+        """days from start to end not published yet, newest first"""
+        published = self._published_days(account)
+        missing = []
+        day = end
+        while day >= start:
+            if day.isoformat() not in published:
+                missing.append(day)
+            day -= timedelta(days=1)
+        return missing
+
+    def _statistic(self, stat_id) -> dict:
+        return self._data["statistics"].setdefault(stat_id, {})
+
+    def is_hour_published(self, stat_id, start: datetime) -> bool:
+        """true when the hour starting at start was published"""
+        day, hour = hour_bucket(start)
+        mask = self._data["statistics"].get(stat_id, {}).get(day, 0)
+        return bool(mask >> hour & 1)
+
+    def mark_hours_published(self, stat_id, stats):
+        """add published statistics to the index"""
+        days = self._statistic(stat_id)
+        for stat in stats:
+            day, hour = hour_bucket(stat["start"])
+            days[day] = days.get(day, 0) | 1 << hour
+        self.save()
+
+    def get_sums(self, stat_id) -> dict:
+        """persisted data of the CumulativeSums of a statistic"""
+        return self._data["sums"].setdefault(stat_id, {})
+
+    def get_fingerprint(self, account, day: date) -> str | None:
+        """fingerprint of the day when it was last published"""
+        return self._account(account).get("fingerprints", {}).get(day.isoformat())
+
+    def set_fingerprint(self, account, day: date, fingerprint, since: date):
+        """record the fingerprint of a day, forgetting the days before since"""
+        fingerprints = self._account(account).setdefault("fingerprints", {})
+        fingerprints[day.isoformat()] = fingerprint
+        for key in [key for key in fingerprints if key < since.isoformat()]:
+            del fingerprints[key]
+        self.save()
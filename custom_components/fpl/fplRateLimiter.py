@@ -0,0 +1,71 @@
+"""Request rate limiter shared by the whole integration"""
+
+import asyncio
+import time
+
+from .const import (
+    BACKGROUND_RATE_LIMIT_BURST,
+    BACKGROUND_RATE_LIMIT_REQUESTS_PER_SECOND,
+    DATA_RATE_LIMITER,
+    DOMAIN,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_REQUESTS_PER_SECOND,
+)
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket limiting the rate of outgoing requests
+
+    The bucket holds up to burst tokens and refills at rate tokens per
+    second, every request takes one token. Requests only wait when the
+    bucket is empty, so idle time is not wasted when there is headroom.
+
+    Background requests first take a token of the background bucket, which
+    refills slower, so they only use a part of the rate.
+    """
+
+    def __init__(
+        self,
+        rate=RATE_LIMIT_REQUESTS_PER_SECOND,
+        burst=RATE_LIMIT_BURST,
+        background: "TokenBucketRateLimiter" = None,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.background = background
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def __refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, background=False):
+        """wait until a request can be sent"""
+        if background and self.background is not None:
+            await self.background.acquire()
+
+        # the lock makes waiting requests go out in arrival order
+        async with self._lock:
+            self.__refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self.__refill()
+            self._tokens -= 1
+
+
+def get_rate_limiter(hass) -> TokenBucketRateLimiter:
+    """Returns the rate limiter shared by all fpl config entries"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_RATE_LIMITER not in domain_data:
+        domain_data[DATA_RATE_LIMITER] = TokenBucketRateLimiter(
+            background=TokenBucketRateLimiter(
+                BACKGROUND_RATE_LIMIT_REQUESTS_PER_SECOND, BACKGROUND_RATE_LIMIT_BURST
+            )
+        )
+    return domain_data[DATA_RATE_LIMITER]
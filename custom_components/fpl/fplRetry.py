@@ -0,0 +1,150 @@
+"""Retry policy and circuit breakers for fpl requests"""
+
+import asyncio
+import logging
+import random
+import time
+
+import aiohttp
+
+from .const import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+from .exceptions import CircuitOpenException
+
+_LOGGER = logging.getLogger(__package__)
+
+# errors worth trying again, anything else is returned to the caller
+TRANSIENT_ERRORS = (
+    asyncio.TimeoutError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+)
+
+
+def is_transient_status(status) -> bool:
+    """Returns true for statuses that may succeed when retried"""
+    return status == 429 or status >= 500
+
+
+class CircuitBreaker:
+    """
+    Stops calling an endpoint that keeps failing
+
+    After threshold failed calls in a row the circuit opens and calls fail
+    right away with CircuitOpenException. Once the cooldown is over a
+    single call is let through, its outcome closes or reopens the circuit.
+    """
+
+    def __init__(
+        self,
+        name,
+        threshold=CIRCUIT_BREAKER_THRESHOLD,
+        cooldown=CIRCUIT_BREAKER_COOLDOWN,
+    ) -> None:
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown.total_seconds()
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def is_open(self) -> bool:
+        """Returns true while calls are rejected"""
+        if self.opened_at is None:
+            return False
+        return time.monotonic() - self.opened_at < self.cooldown
+
+    def check(self):
+        """raise CircuitOpenException if the endpoint should not be called"""
+        if self.is_open:
+            raise CircuitOpenException(f"Circuit open for {self.name}")
+
+    def record_success(self):
+        """the call succeeded"""
+        if self.opened_at is not None:
+            _LOGGER.info("Circuit closed for %s", self.name)
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        """the call failed"""
+        self.failures += 1
+        # a failed trial call after the cooldown reopens the circuit right away
+        if self.failures >= self.threshold or self.opened_at is not None:
+            if not self.is_open:
+                _LOGGER.warning(
+                    "Circuit opened for %s after %s failures", self.name, self.failures
+                )
+            self.opened_at = time.monotonic()
+
+
+class CircuitBreakers:
+    """Circuit breakers by endpoint name"""
+
+    def __init__(self) -> None:
+        self._breakers = {}
+
+    def get(self, name) -> CircuitBreaker:
+        """Returns the circuit breaker of an endpoint"""
+        if name not in self._breakers:
+            self._breakers[name] = CircuitBreaker(name)
+        return self._breakers[name]
+
+
+class RetryPolicy:
+    """Retries transient failures with capped exponential backoff and jitter"""
+
+    def __init__(
+        self,
+        attempts=RETRY_ATTEMPTS,
+        base_delay=RETRY_BASE_DELAY,
+        max_delay=RETRY_MAX_DELAY,
+    ) -> None:
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt) -> float:
+        """seconds to wait before the next attempt, using full jitter"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def call(self, send, breaker: CircuitBreaker = None):
+        """
+        Call send until it succeeds or the attempts are used
+
+        send is an async callable returning a response. Responses with a
+        transient status are retried and the last one is returned, transient
+        errors are retried and the last one is raised.
+        """
+        if breaker is not None:
+            breaker.check()
+
+        for attempt in range(self.attempts):
+            last_attempt = attempt == self.attempts - 1
+            try:
+                response = await send()
+            except TRANSIENT_ERRORS as error:
+                if last_attempt:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    raise
+                _LOGGER.debug("Attempt %s failed: %r", attempt + 1, error)
+            else:
+                if not is_transient_status(response.status):
+                    if breaker is not None:
+                        breaker.record_success()
+                    return response
+                if last_attempt:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    return response
+                _LOGGER.debug(
+                    "Attempt %s failed with status %s", attempt + 1, response.status
+                )
+
+            await asyncio.sleep(self.delay(attempt))
@@ -0,0 +1,59 @@
+"""aiohttp sessions tuned for fpl"""
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    CONNECTION_LIMIT_PER_HOST,
+    DATA_CONNECTOR,
+    DNS_CACHE_TTL,
+    DOMAIN,
+    KEEPALIVE_TIMEOUT,
+)
+
+
+@callback
+def async_get_connector(hass: HomeAssistant) -> aiohttp.TCPConnector:
+    """
+    Returns the connector shared by all fpl sessions
+
+    Connections to www.fpl.com and cognito are kept alive between polls and
+    dns lookups are cached, so polls do not repeat the tls handshake.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    connector = domain_data.get(DATA_CONNECTOR)
+    if connector is not None and not connector.closed:
+        return connector
+
+    connector = aiohttp.TCPConnector(
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ssl=get_default_context(),
+    )
+    domain_data[DATA_CONNECTOR] = connector
+
+    async def _async_close_connector(_event):
+        await connector.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_connector)
+    return connector
+
+
+@callback
+def async_create_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """
+    Create a session using the shared fpl connector
+
+    Every session has its own cookies, so logins of different entries do
+    not mix. The caller closes the session, the connector stays open.
+    """
+    return aiohttp.ClientSession(
+        connector=async_get_connector(hass),
+        connector_owner=False,
+        headers={"User-Agent": SERVER_SOFTWARE},
+    )
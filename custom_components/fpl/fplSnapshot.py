@@ -0,0 +1,102 @@
+"""Persisted snapshot of the coordinator data"""
+
+import hashlib
+import json
+from datetime import date, datetime
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import STORAGE_KEY_SNAPSHOT, STORAGE_VERSION
+from .fplHourlySeries import HourlySeries
+
+# delay before a changed snapshot is written
+SAVE_DELAY = 30
+# delay before only the time of the snapshot is written, it is also written
+# when home assistant stops
+TOUCH_DELAY = 3600
+
+TYPE_KEY = "__type__"
+
+
+def encode(value):
+    """json friendly copy of value, dates and series are tagged"""
+    if isinstance(value, dict):
+        return {key: encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    # datetime is a subclass of date
+    if isinstance(value, datetime):
+        return {TYPE_KEY: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {TYPE_KEY: "date", "value": value.isoformat()}
+    if isinstance(value, HourlySeries):
+        return {TYPE_KEY: "hourly_series", "value": value.as_dict()}
+    return value
+
+
+def decode(value):
+    """inverse of encode"""
+    if isinstance(value, dict):
+        kind = value.get(TYPE_KEY)
+        if kind == "datetime":
+            return datetime.fromisoformat(value["value"])
+        if kind == "date":
+            return date.fromisoformat(value["value"])
+        if kind == "hourly_series":
+            return HourlySeries.from_dict(value["value"])
+        return {key: decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    return value
+
+
+class CoordinatorSnapshot:
+    """
+    Last data of a coordinator, kept across restarts
+
+    The sensors are restored from it at startup, before the first update
+    reached fpl. The data is written soon after it changed, when only the
+    time of the data changed the write is delayed.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id) -> None:
+        self._store = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY_SNAPSHOT}.{entry_id}", private=True
+        )
+        self._digest = None
+        self._pending = None
+        self._changed = False
+
+    @staticmethod
+    def _hash(encoded) -> str:
+        return hashlib.sha1(
+            json.dumps(encoded, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+
+    async def async_load(self):
+        """data and fetch time of the snapshot, None when there is none"""
+        stored = await self._store.async_load()
+        if not stored:
+            return None
+        self._digest = self._hash(stored["data"])
+        return decode(stored["data"]), datetime.fromisoformat(stored["fetched_at"])
+
+    def save(self, data: dict, fetched_at: datetime):
+        """schedule writing the snapshot of data fetched at fetched_at"""
+        encoded = encode(data)
+        digest = self._hash(encoded)
+        self._changed = self._changed or digest != self._digest
+        self._digest = digest
+        self._pending = {"fetched_at": fetched_at.isoformat(), "data": encoded}
+        self._store.async_delay_save(
+            self._data_to_save, SAVE_DELAY if self._changed else TOUCH_DELAY
+        )
+
+    def _data_to_save(self) -> dict:
+        self._changed = False
+        return self._pending
+
+    async def async_remove(self):
+        """remove the snapshot"""
+        await self._store.async_remove()
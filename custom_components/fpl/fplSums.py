@@ -0,0 +1,105 @@
+"""Running sums of statistics spliced out of order"""
+
+import bisect
+
+
+class CumulativeSums:
+    """
+    Running sums of a statistic, by bucket
+
+    The values are grouped in buckets, like the hours of a day, keyed by
+    key(start) returning the bucket and the slot in the bucket. start(bucket,
+    slot) is the inverse. Every bucket keeps its values and the sum after its
+    last value, so a value spliced anywhere only rewrites the rows of its
+    bucket, the later rows are shifted with adjustments.
+
+    data is the persisted dict of the buckets, changed in place.
+    """
+
+    def __init__(self, data: dict, key, start) -> None:
+        self._data = data
+        self._key = key
+        self._start = start
+        self._buckets = sorted(data)
+
+    def _group(self, points) -> dict:
+        buckets = {}
+        for start, value in points:
+            bucket, slot = self._key(start)
+            buckets.setdefault(bucket, {})[str(slot)] = value
+        return buckets
+
+    def _sum_before(self, bucket, base):
+        index = bisect.bisect_left(self._buckets, bucket)
+        if index == 0:
+            return base
+        return self._data[self._buckets[index - 1]][0]
+
+    def _set(self, bucket, total, values):
+        if bucket not in self._data:
+            bisect.insort(self._buckets, bucket)
+        self._data[bucket] = [total, values]
+
+    def has_bucket(self, start) -> bool:
+        """true when the bucket of start is known"""
+        bucket, _ = self._key(start)
+        return bucket in self._data
+
+    def needs_base(self, start) -> bool:
+        """true when no bucket is known before the bucket of start"""
+        bucket, _ = self._key(start)
+        return bisect.bisect_left(self._buckets, bucket) == 0
+
+    def seed(self, points, base=0.0) -> None:
+        """
+        Record values already published, without rows nor adjustments
+
+        base is the sum before the points when no bucket is known before.
+        """
+        for bucket, values in sorted(self._group(points).items()):
+            if bucket not in self._data:
+                total = self._sum_before(bucket, base) + sum(values.values())
+                self._set(bucket, total, values)
+
+    def splice(self, points, base=0.0):
+        """
+        Splice (start, value) points in the sums
+
+        Returns the rows to publish, as (start, value, sum) tuples, and the
+        adjustments of the published rows after the changed buckets, as
+        (since, delta) tuples. The adjustments must be applied before the
+        rows are published. base is the sum before the points when no bucket
+        is known before them.
+        """
+        rows = []
+        adjustments = []
+        for bucket, values in sorted(self._group(points).items()):
+            old_total, old = self._data.get(bucket, (None, {}))
+            changed = [
+                int(slot) for slot, value in values.items() if old.get(slot) != value
+            ]
+            if not changed:
+                continue
+
+            merged = {**old, **values}
+            slots = sorted(int(slot) for slot in merged)
+            first = min(changed)
+            before = self._sum_before(bucket, base)
+            total = before
+            for slot in slots:
+                value = merged[str(slot)]
+                total += value
+                if slot >= first:
+                    rows.append((self._start(bucket, slot), value, total))
+
+            # a new bucket shifts everything after it by its whole sum
+            delta = total - (before if old_total is None else old_total)
+            self._set(bucket, total, merged)
+            if delta:
+                adjustments.append((self._start(bucket, slots[-1] + 1), delta))
+                for later in self._buckets[
+                    bisect.bisect_right(self._buckets, bucket) :
+                ]:
+                    self._data[later][0] += delta
+
+        return rows, adjustments
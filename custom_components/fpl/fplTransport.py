@@ -0,0 +1,293 @@
+"""Http transport shared by the fpl api clients"""
+
+import itertools
+import json
+import logging
+import time
+
+import async_timeout
+
+from .const import API_HOST, LOGIN_RESULT_OK, TIMEOUT
+from .fplRetry import CircuitBreakers, RetryPolicy
+
+_LOGGER = logging.getLogger(__package__)
+
+_request_ids = itertools.count(1)
+
+
+class FplRequest:
+    """A request sent through the transport"""
+
+    def __init__(
+        self,
+        method,
+        url,
+        endpoint,
+        account=None,
+        headers=None,
+        json=None,  # pylint: disable=redefined-outer-name
+        auth=None,
+        authenticate=True,
+        background=False,
+    ) -> None:
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.account = account
+        self.headers = dict(headers or {})
+        self.json = json
+        self.auth = auth
+        # False for requests that must not carry the login tokens, like the login
+        self.authenticate = authenticate
+        # True for the requests of the statistics import, rate limited apart
+        self.background = background
+        self.id = next(_request_ids)
+
+
+class FplResponse:
+    """A response with its body already read"""
+
+    def __init__(self, status, headers, body: bytes) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.from_cache = False
+        self._json = None
+
+    def text(self) -> str:
+        """body as text"""
+        return self.body.decode("utf-8")
+
+    def json(self):
+        """body parsed as json, parsed only once"""
+        if self._json is None:
+            self._json = json.loads(self.body)
+        return self._json
+
+
+class FplTransport:
+    """
+    Sends requests through a chain of middlewares
+
+    A middleware is an async callable receiving the request and the next
+    handler of the chain, it returns the response. The first middleware is
+    the outermost one, the last handler sends the request.
+    """
+
+    def __init__(self, session, middlewares=(), timeout=TIMEOUT) -> None:
+        self.session = session
+        self.middlewares = list(middlewares)
+        self.timeout = timeout
+        self._handler = self.__build_chain(0)
+
+    def __build_chain(self, index):
+        if index == len(self.middlewares):
+            return self.__send
+
+        middleware = self.middlewares[index]
+        next_handler = self.__build_chain(index + 1)
+
+        async def handler(request):
+            return await middleware(request, next_handler)
+
+        return handler
+
+    async def request(self, request: FplRequest) -> FplResponse:
+        """send a request through the middlewares"""
+        return await self._handler(request)
+
+    async def __send(self, request: FplRequest) -> FplResponse:
+        async with async_timeout.timeout(self.timeout):
+            async with self.session.request(
+                request.method,
+                request.url,
+                headers=request.headers,
+                json=request.json,
+                auth=request.auth,
+            ) as response:
+                body = await response.read()
+                return FplResponse(response.status, response.headers, body)
+
+
+class TransportMetrics:
+    """Request counts and latencies by endpoint"""
+
+    def __init__(self) -> None:
+        self.endpoints = {}
+
+    def record(self, endpoint, elapsed, from_cache=False, failed=False):
+        """record a finished request"""
+        stats = self.endpoints.setdefault(
+            endpoint, {"requests": 0, "cached": 0, "failed": 0, "time": 0.0}
+        )
+        if from_cache:
+            stats["cached"] += 1
+            return
+        stats["requests"] += 1
+        stats["time"] += elapsed
+        if failed:
+            stats["failed"] += 1
+
+    def summary(self) -> str:
+        """one line summary of the metrics"""
+        return ", ".join(
+            f"{endpoint}: {stats['requests']} sent ({stats['failed']} failed, "
+            f"{stats['time']:.2f}s), {stats['cached']} cached"
+            for endpoint, stats in self.endpoints.items()
+        )
+
+
+class MetricsMiddleware:
+    """records request counts and latencies"""
+
+    def __init__(self, metrics: TransportMetrics) -> None:
+        self.metrics = metrics
+
+    async def __call__(self, request, handler):
+        start = time.monotonic()
+        try:
+            response = await handler(request)
+        except Exception:
+            self.metrics.record(request.endpoint, time.monotonic() - start, failed=True)
+            raise
+        self.metrics.record(
+            request.endpoint,
+            time.monotonic() - start,
+            from_cache=response.from_cache,
+            failed=response.status != 200,
+        )
+        return response
+
+
+class TracingMiddleware:
+    """logs every request sent"""
+
+    async def __call__(self, request, handler):
+        _LOGGER.debug(
+            "[%s] %s %s (%s)",
+            request.id,
+            request.method,
+            request.url,
+            request.endpoint,
+        )
+        start = time.monotonic()
+        try:
+            response = await handler(request)
+        except Exception as error:
+            _LOGGER.debug("[%s] failed: %r", request.id, error)
+            raise
+        _LOGGER.debug(
+            "[%s] %s in %.3fs", request.id, response.status, time.monotonic() - start
+        )
+        return response
+
+
+class CacheMiddleware:
+    """serves successful responses from a ResponseCache while fresh"""
+
+    def __init__(self, cache) -> None:
+        self.cache = cache
+
+    async def __call__(self, request, handler):
+        if not self.cache.is_cached(request.endpoint):
+            return await handler(request)
+
+        key = (request.method, request.url, json.dumps(request.json, sort_keys=True))
+        cached = self.cache.get(request.endpoint, request.account, key)
+        if cached is not None:
+            response = FplResponse(cached.status, cached.headers, cached.body)
+            # share the parsed json of the cached response
+            response._json = cached._json  # pylint: disable=protected-access
+            response.from_cache = True
+            return response
+
+        response = await handler(request)
+        if response.status == 200:
+            self.cache.set(request.endpoint, request.account, key, response)
+        return response
+
+
+class AuthMiddleware:
+    """
+    Adds the login tokens to requests
+
+    apply_auth receives the request and the TokenAuthManager and sets the
+    headers. When the tokens are rejected with 401 or 403 they are renewed
+    and the request is sent once more.
+    """
+
+    def __init__(self, auth, apply_auth) -> None:
+        self.auth = auth
+        self.apply_auth = apply_auth
+
+    async def __call__(self, request, handler):
+        if not request.authenticate:
+            return await handler(request)
+
+        tokens = self.auth.tokens
+        self.apply_auth(request, self.auth)
+        response = await handler(request)
+
+        if response.status in (401, 403):
+            _LOGGER.info("Token rejected with status %s", response.status)
+            if await self.auth.async_reauthenticate(tokens) == LOGIN_RESULT_OK:
+                self.apply_auth(request, self.auth)
+                response = await handler(request)
+
+        return response
+
+
+class RetryMiddleware:
+    """retries transient failures, skipping endpoints that keep failing"""
+
+    def __init__(self, policy: RetryPolicy, breakers: CircuitBreakers) -> None:
+        self.policy = policy
+        self.breakers = breakers
+
+    async def __call__(self, request, handler):
+        async def send():
+            return await handler(request)
+
+        return await self.policy.call(send, self.breakers.get(request.endpoint))
+
+
+class RateLimitMiddleware:
+    """waits for the shared rate limiter before sending requests to fpl"""
+
+    def __init__(self, limiter, url_prefix=API_HOST) -> None:
+        self.limiter = limiter
+        self.url_prefix = url_prefix
+
+    async def __call__(self, request, handler):
+        if request.url.startswith(self.url_prefix):
+            await self.limiter.acquire(request.background)
+        return await handler(request)
+
+
+def create_transport(
+    session,
+    auth=None,
+    apply_auth=None,
+    cache=None,
+    rate_limiter=None,
+    metrics=None,
+) -> FplTransport:
+    """
+    Returns a transport with the standard middleware chain
+
+    From outermost to innermost: metrics, cache, auth, retry, rate limit and
+    tracing, so every retry attempt is rate limited and traced.
+    """
+    middlewares = []
+    if metrics is not None:
+        middlewares.append(MetricsMiddleware(metrics))
+    if cache is not None:
+        middlewares.append(CacheMiddleware(cache))
+    if auth is not None:
+        middlewares.append(AuthMiddleware(auth, apply_auth))
+    middlewares.append(RetryMiddleware(RetryPolicy(), CircuitBreakers()))
+    if rate_limiter is not None:
+        middlewares.append(RateLimitMiddleware(rate_limiter))
+    middlewares.append(TracingMiddleware())
+
+    return FplTransport(session, middlewares)
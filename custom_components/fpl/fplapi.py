@@ -1,41 +1,63 @@
 """Custom FPl api client"""
 
 import sys
-import json
 import logging
+import asyncio
 
-import async_timeout
-
+from homeassistant.helpers.importlib import async_import_module
 
 from .const import (
     CONF_ACCOUNTS,
     CONF_TERRITORY,
+    DEFAULT_ACCOUNT_CONCURRENCY,
     FPL_MAINREGION,
     LOGIN_RESULT_FAILURE,
     LOGIN_RESULT_OK,
-    TIMEOUT,
     API_HOST,
 )
 
-from .FplMainRegionApiClient import FplMainRegionApiClient
-from .FplNorthwestRegionApiClient import FplNorthwestRegionApiClient
-
+from .fplTransport import FplRequest, TransportMetrics, create_transport
 
 _LOGGER = logging.getLogger(__package__)
 
 
 URL_TERRITORY = API_HOST + "/cs/customer/v1/territoryid/public/territory"
+ENDPOINT_TERRITORY = "territory"
+ENDPOINT_PREWARM = "prewarm"
+
+# The region clients are imported once the territory is known, a config entry
+# only ever uses one of them.
+MAIN_REGION_CLIENT = ("FplMainRegionApiClient", "FplMainRegionApiClient")
+NORTHWEST_REGION_CLIENT = ("FplNorthwestRegionApiClient", "FplNorthwestRegionApiClient")
 
 
 class FplApi:
     """A class for getting energy usage information from Florida Power & Light."""
 
-    def __init__(self, username, password, session, loop):
+    def __init__(
+        self,
+        username,
+        password,
+        session,
+        loop,
+        account_concurrency=DEFAULT_ACCOUNT_CONCURRENCY,
+        token_store=None,
+        rate_limiter=None,
+        hass=None,
+    ):
         """Initialize the data retrieval. Session should have BasicAuth flag set."""
+        self._hass = hass
         self._username = username
         self._password = password
         self._session = session
         self._loop = loop
+        self._account_concurrency = account_concurrency
+        self._token_store = token_store
+        self._rate_limiter = rate_limiter
+        self.metrics = TransportMetrics()
+        self._transport = create_transport(
+            session, rate_limiter=rate_limiter, metrics=self.metrics
+        )
         self._territory = None
         self.access_token = None
         self.id_token = None
@@ -48,11 +70,12 @@ class FplApi:
             return self._territory
 
         headers = {"userID": f"{self._username}", "channel": "WEB"}
-        async with async_timeout.timeout(TIMEOUT):
-            response = await self._session.get(URL_TERRITORY, headers=headers)
+        response = await self._transport.request(
+            FplRequest("GET", URL_TERRITORY, ENDPOINT_TERRITORY, headers=headers)
+        )
 
         if response.status == 200:
-            json_data = json.loads(await response.text())
+            json_data = response.json()
 
             territoryArray = json_data["data"]["territory"]
             if len(territoryArray) == 0:
@@ -61,23 +84,52 @@ class FplApi:
 
             return territoryArray[0]
 
+    async def async_prewarm(self):
+        """open the connection to fpl ahead of the next update"""
+        try:
+            await self._transport.request(
+                FplRequest("HEAD", API_HOST + "/", ENDPOINT_PREWARM)
+            )
+        except Exception as exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Connection pre-warm failed: %s", exception)
+
     def isMainRegion(self):
         """Returns true if this account belongs to the main region, not northwest"""
         return self._territory == FPL_MAINREGION
 
+    async def _async_import_client(self):
+        """import the api client class of the territory, off the event loop"""
+        module_name, class_name = (
+            MAIN_REGION_CLIENT if self.isMainRegion() else NORTHWEST_REGION_CLIENT
+        )
+        module = await async_import_module(self._hass, f"{__package__}.{module_name}")
+        return getattr(module, class_name)
+
     async def initialize(self):
         """initialize the api client"""
         self._territory = await self.getTerritory()
 
         # set the api client based on user's territory
         if self.apiClient is None:
+            client_class = await self._async_import_client()
             if self.isMainRegion():
-                self.apiClient = FplMainRegionApiClient(
-                    self._username, self._password, self._loop, self._session
+                self.apiClient = client_class(
+                    self._username,
+                    self._password,
+                    self._loop,
+                    self._session,
+                    rate_limiter=self._rate_limiter,
+                    metrics=self.metrics,
                 )
             else:
-                self.apiClient = FplNorthwestRegionApiClient(
-                    self._username, self._password, self._loop, self._session
+                self.apiClient = client_class(
+                    self._username,
+                    self._password,
+                    self._loop,
+                    self._session,
+                    token_store=self._token_store,
+                    rate_limiter=self._rate_limiter,
+                    metrics=self.metrics,
                 )
 
     async def get_basic_info(self):
@@ -97,16 +149,50 @@ class FplApi:
 
         data[CONF_TERRITORY] = self._territory
 
-        login_result = await self.apiClient.login()
+        # the login is kept between updates, it is only renewed when expired
+        login_result = await self.apiClient.ensure_login()
 
         if login_result == LOGIN_RESULT_OK:
             accounts = await self.apiClient.get_open_accounts()
 
             data[CONF_ACCOUNTS] = accounts
-            for account in accounts:
-                data[account] = await self.apiClient.update(account)
+            data.update(await self.async_update_accounts(accounts))
+
+        _LOGGER.debug("Request metrics: %s", self.metrics.summary())
+        return data
+
+    async def async_update_accounts(self, accounts) -> dict:
+        """
+        Update all accounts concurrently
+
+        At most account_concurrency accounts are in flight at the same time.
+        Accounts that fail are logged and left out of the result, so one
+        failing account does not prevent the others from updating. If every
+        account fails the first error is raised.
+        """
+        semaphore = asyncio.Semaphore(max(1, self._account_concurrency))
+
+        async def update_account(account):
+            async with semaphore:
+                return await self.apiClient.update(account)
+
+        results = await asyncio.gather(
+            *[update_account(account) for account in accounts],
+            return_exceptions=True,
+        )
+
+        data = {}
+        errors = []
+        for account, result in zip(accounts, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error updating account %s: %s", account, result)
+                errors.append(result)
+                continue
+            data[account] = result
+
+        if errors and not data:
+            raise errors[0]
 
-            await self.apiClient.logout()
         return data
 
     async def login(self):
@@ -130,4 +216,6 @@ class FplApi:
 
     async def logout(self):
         """log out from fpl"""
+        if self.apiClient is None:
+            return None
         return await self.apiClient.logout()
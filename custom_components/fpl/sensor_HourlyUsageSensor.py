@@ -1,6 +1,7 @@
 """Hourly Usage Sensors"""
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.util import dt as dt_util
 
 
 from .fplEntity import FplEnergyEntity, FplMoneyEntity
@@ -24,7 +25,7 @@ class FplHourlyUsageSensor(FplMoneyEntity):
     def native_value(self):
         data = self.getData("HourlyUsage")
         if data:
-            self._attr_native_value = data[-1]["billingCharged"]
+            self._attr_native_value = data[-1].billing_charged
         return self._attr_native_value
 
     def customAttributes(self):
@@ -32,8 +33,9 @@ class FplHourlyUsageSensor(FplMoneyEntity):
         data = self.getData("HourlyUsage")
         return (
             {
-                "date": data[-1]["readTime"],
-                "hour": data[-1]["hour"],
+                # the series keeps utc times, fpl gives the local time
+                "date": dt_util.as_local(data[-1].read_time),
+                "hour": data[-1].hour,
             }
             if data
             else {}
@@ -63,7 +65,7 @@ class FplHourlyUsageKWHSensor(FplEnergyEntity):
     def native_value(self):
         data = self.getData("HourlyUsage")
         if data:
-            self._attr_native_value = data[-1]["kwhActual"]
+            self._attr_native_value = data[-1].kwh_actual
         return self._attr_native_value
 
     def customAttributes(self):
@@ -71,8 +73,9 @@ class FplHourlyUsageKWHSensor(FplEnergyEntity):
         data = self.getData("HourlyUsage")
         return (
             {
-                "date": data[-1]["readTime"],
-                "hour": data[-1]["hour"],
+                # the series keeps utc times, fpl gives the local time
+                "date": dt_util.as_local(data[-1].read_time),
+                "hour": data[-1].hour,
             }
             if data
             else {}
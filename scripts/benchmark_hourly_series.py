@@ -0,0 +1,114 @@
+"""
+Compare the memory and time of HourlySeries with a list of dicts
+
+Usage: python scripts/benchmark_hourly_series.py [days]
+"""
+
+import importlib.util
+import pathlib
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+MODULE_PATH = (
+    pathlib.Path(__file__).parent.parent
+    / "custom_components"
+    / "fpl"
+    / "fplHourlySeries.py"
+)
+
+
+def load_series_module():
+    """load fplHourlySeries without importing home assistant"""
+    spec = importlib.util.spec_from_file_location("fplHourlySeries", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def payload(days):
+    """hourly usage data shaped like the fpl response"""
+    start = datetime(2023, 1, 1, tzinfo=timezone(timedelta(hours=-5)))
+    reading = 10000.0
+    for index in range(days * 24):
+        reading += 1.25
+        yield {
+            "hour": index % 24 + 1,
+            "readTime": (start + timedelta(hours=index + 1)).isoformat(),
+            "billingCharged": 0.17,
+            "kwhActual": 1.25,
+            "reading": reading,
+        }
+
+
+def as_dicts(hourly_usage):
+    """the list of dicts get_hourly_usage used to return"""
+    return [
+        {
+            "hour": hour_usage.get("hour"),
+            "readTime": datetime.fromisoformat(hour_usage["readTime"]),
+            "billingCharged": hour_usage.get("billingCharged"),
+            "kwhActual": hour_usage["kwhActual"],
+            "reading": hour_usage["reading"],
+        }
+        for hour_usage in hourly_usage
+    ]
+
+
+def consume_dicts(data):
+    """what the coordinator does with every hour"""
+    total = 0.0
+    for hour in sorted(data, key=lambda hour: hour["readTime"]):
+        start = hour["readTime"].replace(minute=0, second=0, microsecond=0)
+        total += hour["billingCharged"] + (start - timedelta(hours=1)).hour
+    return total
+
+
+def consume_series(series):
+    """what the coordinator does with every hour"""
+    total = 0.0
+    series.sort()
+    for hour in series:
+        total += hour.billing_charged + hour.start.hour
+    return total
+
+
+def best_time(func, *args, repeat=5):
+    """fastest of repeat runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def measure(name, build, consume, raw):
+    """print the memory held and the time to build and consume the data"""
+    tracemalloc.start()
+    data = build(raw)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    built = best_time(build, raw)
+    consumed = best_time(consume, data)
+
+    print(
+        f"{name:>14}: {size / 1024:9.1f} KiB held, {size / len(raw):6.1f} bytes/hour,"
+        f" build {built * 1000:7.1f} ms, consume {consumed * 1000:7.1f} ms"
+    )
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    module = load_series_module()
+    raw = list(payload(days))
+
+    print(f"{days} days, {len(raw)} hours")
+    measure("list of dicts", as_dicts, consume_dicts, raw)
+    measure("HourlySeries", module.HourlySeries.from_json, consume_series, raw)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Compare importing the region clients eagerly with importing them lazily
+
+Before, fplapi.py imported both region clients at module level. Now it
+imports the client of the territory once it is known. Every scenario is
+imported in fresh interpreters started at the repository root, and the
+median time, the modules loaded and the memory allocated are reported.
+
+    before           fplapi and both region clients, the eager imports
+    after, setup     fplapi alone, until the territory is known
+    after, main      fplapi and the main region client
+    after, northwest fplapi and the northwest region client
+
+The package __init__ is not run, and home assistant is stubbed, so only
+the modules of the api client are measured. aiohttp and async_timeout are
+stubbed when they are not installed. Until the SRP login moved to aiohttp,
+the northwest client also imported boto3 and six. When they are installed,
+the before scenario is measured with them too.
+
+Usage: python scripts/benchmark_import_time.py [runs]
+"""
+
+import importlib.util
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).parent.parent
+PACKAGE = "custom_components.fpl"
+FPLAPI = f"{PACKAGE}.fplapi"
+MAIN = f"{PACKAGE}.FplMainRegionApiClient"
+NORTHWEST = f"{PACKAGE}.FplNorthwestRegionApiClient"
+
+SCENARIOS = [
+    ("before", [FPLAPI, MAIN, NORTHWEST]),
+    ("after, setup", [FPLAPI]),
+    ("after, main", [FPLAPI, MAIN]),
+    ("after, northwest", [FPLAPI, NORTHWEST]),
+]
+REMOVED_DEPENDENCIES = ["boto3", "six"]
+
+# run in the fresh interpreter, prints the time, the number of modules
+# loaded and the memory allocated by the imports
+CHILD = """
+import importlib, importlib.abc, importlib.util, json, sys, time, tracemalloc, types
+
+STUBBED = set({stubbed!r})
+
+
+class Stub(types.ModuleType):
+    __path__ = []
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = type(name, (), {{
+            "__init__": lambda self, *args, **kwargs: None,
+            "__call__": lambda self, *args, **kwargs: self,
+            "__class_getitem__": classmethod(lambda cls, item: cls),
+        }})
+        setattr(self, name, value)
+        return value
+
+
+class StubLoader(importlib.abc.Loader):
+    def create_module(self, spec):
+        return Stub(spec.name)
+
+    def exec_module(self, module):
+        pass
+
+
+class StubFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".")[0] in STUBBED:
+            return importlib.util.spec_from_loader(fullname, StubLoader())
+        return None
+
+
+sys.meta_path.insert(0, StubFinder())
+for name, path in (("custom_components", "custom_components"),
+                   ("custom_components.fpl", "custom_components/fpl")):
+    package = types.ModuleType(name)
+    package.__path__ = [path]
+    sys.modules[name] = package
+
+trace = {trace!r}
+if trace:
+    tracemalloc.start()
+loaded = len(sys.modules)
+start = time.perf_counter()
+for module in {modules!r}:
+    importlib.import_module(module)
+elapsed = time.perf_counter() - start
+size = tracemalloc.get_traced_memory()[0] if trace else 0
+print(json.dumps([elapsed, len(sys.modules) - loaded, size]))
+"""
+
+
+def is_installed(module) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def run(modules, stubbed, trace=False):
+    """time, modules loaded and memory of importing modules"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            CHILD.format(stubbed=sorted(stubbed), modules=modules, trace=trace),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    return json.loads(result.stdout)
+
+
+def measure(modules, stubbed, runs):
+    """median time in seconds, modules loaded and memory in bytes"""
+    times = [run(modules, stubbed)[0] for _ in range(runs)]
+    _, loaded, size = run(modules, stubbed, trace=True)
+    return statistics.median(times), loaded, size
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    stubbed = {"homeassistant"} | {
+        module for module in ("aiohttp", "async_timeout") if not is_installed(module)
+    }
+    scenarios = list(SCENARIOS)
+    if all(is_installed(module) for module in REMOVED_DEPENDENCIES):
+        scenarios.insert(1, ("before, boto3", SCENARIOS[0][1] + REMOVED_DEPENDENCIES))
+
+    print(f"stubbed: {', '.join(sorted(stubbed))}, median of {runs} runs")
+    results = {}
+    for name, modules in scenarios:
+        results[name] = measure(modules, stubbed, runs)
+
+    before_time, before_loaded, before_size = results["before"]
+    for name, (elapsed, loaded, size) in results.items():
+        print(
+            f"{name:>16}: {elapsed * 1000:7.2f} ms ({elapsed / before_time:4.0%}),"
+            f" {loaded:3} modules ({loaded - before_loaded:+}),"
+            f" {size / 1024:7.1f} KiB ({(size - before_size) / 1024:+.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Tests for the response cache"""
+
+from datetime import timedelta
+
+from custom_components.fpl import fplCache
+from custom_components.fpl.fplCache import ResponseCache
+
+TTLS = {"energy_usage": timedelta(hours=1)}
+
+
+def test_expired_entries_are_purged_when_caching(monkeypatch):
+    """entries never read again are dropped once expired"""
+    now = [0.0]
+    monkeypatch.setattr(fplCache.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(TTLS)
+
+    for day in range(10):
+        cache.set("energy_usage", "1", day, f"response {day}")
+        now[0] += 1200
+
+    # the first 8 entries expired before the last one was cached
+    cache.set("energy_usage", "1", "latest", "response")
+    assert cache.get("energy_usage", "1", 0) is None
+    assert cache.get("energy_usage", "1", 9) == "response 9"
+    assert len(cache._entries) == 3  # pylint: disable=protected-access
+
+
+def test_size_is_capped():
+    """the entries expiring first are dropped beyond max entries"""
+    cache = ResponseCache(TTLS, max_entries=3)
+
+    for day in range(5):
+        cache.set("energy_usage", "1", day, f"response {day}")
+
+    assert cache.get("energy_usage", "1", 1) is None
+    assert cache.get("energy_usage", "1", 4) == "response 4"
+    assert len(cache._entries) == 3  # pylint: disable=protected-access
+
+
+def test_endpoints_without_ttl_are_not_cached():
+    """responses of endpoints without a ttl are not kept"""
+    cache = ResponseCache(TTLS)
+
+    cache.set("hourly_usage", "1", "day", "response")
+
+    assert not cache.is_cached("hourly_usage")
+    assert cache.get("hourly_usage", "1", "day") is None
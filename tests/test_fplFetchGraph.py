@@ -0,0 +1,56 @@
+"""Tests for the fetch graph executor"""
+
+import asyncio
+
+import pytest
+
+from custom_components.fpl.fplFetchGraph import FetchGraph
+
+
+def test_dependent_node_receives_required_result():
+    """a node is called with the results of its required nodes by name"""
+    graph = FetchGraph()
+
+    async def fetch_account():
+        return {"premise": "123"}
+
+    async def fetch_usage(account_info):
+        return {"premise": account_info["premise"], "usage": 10}
+
+    graph.add("account_info", fetch_account)
+    graph.add("usage", fetch_usage, requires=["account_info"])
+
+    results = asyncio.run(graph.execute())
+
+    assert results == {
+        "account_info": {"premise": "123"},
+        "usage": {"premise": "123", "usage": 10},
+    }
+
+
+def test_failed_node_fails_dependents():
+    """the error of a required node is raised"""
+    graph = FetchGraph()
+
+    async def fetch_account():
+        raise RuntimeError("lander failed")
+
+    async def fetch_usage(account_info):
+        return account_info
+
+    graph.add("account_info", fetch_account)
+    graph.add("usage", fetch_usage, requires=["account_info"])
+
+    with pytest.raises(RuntimeError, match="lander failed"):
+        asyncio.run(graph.execute())
+
+
+def test_unknown_requirement():
+    """nodes must be added after the nodes they require"""
+    graph = FetchGraph()
+
+    async def fetch_usage(account_info):
+        return account_info
+
+    with pytest.raises(ValueError):
+        graph.add("usage", fetch_usage, requires=["account_info"])
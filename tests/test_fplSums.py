@@ -0,0 +1,122 @@
+"""Tests for the running sums of statistics"""
+
+from custom_components.fpl.fplSums import CumulativeSums
+
+
+def hour_key(start):
+    """day and hour of an hour counted from the first hour"""
+    return f"{start // 24:04d}", start % 24
+
+
+def hour_start(day, hour):
+    """inverse of hour_key"""
+    return int(day) * 24 + hour
+
+
+def day_points(day, value=1.0):
+    """(start, value) of the hours of a day"""
+    return [(hour_start(f"{day:04d}", hour), value) for hour in range(24)]
+
+
+def make_sums(data=None):
+    return CumulativeSums({} if data is None else data, hour_key, hour_start)
+
+
+def test_splice_new_days_continue_the_sum():
+    """rows of a new day start from the closing sum of the day before"""
+    sums = make_sums()
+
+    rows, adjustments = sums.splice(day_points(0), base=10.0)
+    assert rows[0] == (0, 1.0, 11.0)
+    assert rows[-1] == (23, 1.0, 34.0)
+    # a new day shifts the rows after it, there are none yet
+    assert adjustments == [(24, 24.0)]
+
+    rows, adjustments = sums.splice(day_points(1))
+    assert rows[0] == (24, 1.0, 35.0)
+    assert rows[-1] == (47, 1.0, 58.0)
+    assert adjustments == [(48, 24.0)]
+
+
+def test_splice_unchanged_day_publishes_nothing():
+    """a day published again with the same values has no rows"""
+    sums = make_sums()
+    sums.splice(day_points(0))
+
+    assert sums.splice(day_points(0)) == ([], [])
+
+
+def test_splice_revision_shifts_later_days():
+    """a revised hour rewrites its day and shifts the later days"""
+    sums = make_sums()
+    for day in range(3):
+        sums.splice(day_points(day))
+
+    rows, adjustments = sums.splice([(hour_start("0001", 5), 3.0)])
+
+    # the rows from the revised hour to the end of its day
+    assert rows[0] == (29, 3.0, 32.0)
+    assert rows[-1] == (47, 1.0, 50.0)
+    assert adjustments == [(48, 2.0)]
+
+    rows, _ = sums.splice(day_points(3))
+    assert rows[0] == (72, 1.0, 75.0)
+
+
+def test_splice_older_day_shifts_newer_days():
+    """a day older than the known days is inserted with its base"""
+    sums = make_sums()
+    sums.splice(day_points(5), base=120.0)
+
+    rows, adjustments = sums.splice(day_points(4, value=2.0), base=96.0)
+
+    assert rows[0] == (96, 2.0, 98.0)
+    assert rows[-1] == (119, 2.0, 144.0)
+    assert adjustments == [(120, 48.0)]
+
+    rows, _ = sums.splice(day_points(6))
+    assert rows[0] == (144, 1.0, 193.0)
+
+
+def test_seed_has_no_rows_and_keeps_the_sum():
+    """seeded days are recorded without rows"""
+    sums = make_sums()
+    sums.seed(day_points(0), base=5.0)
+
+    assert sums.has_bucket(0)
+    assert not sums.needs_base(24)
+    rows, _ = sums.splice(day_points(1))
+    assert rows[0] == (24, 1.0, 30.0)
+
+
+def test_upgrade_seeds_from_the_recorder_sum():
+    """
+    days published before the running sums existed are seeded from the sum
+    of the recorder before them, the next day continues that sum
+    """
+    # 100 days at 1.0 per hour were published, the recorder sum before a
+    # day is 24 per day
+    recorder_sum_before = {day: day * 24.0 for day in range(101)}
+
+    sums = make_sums()
+    # the recent days are seeded newest first, each with its own base
+    for day in (99, 98, 97):
+        start = hour_start(f"{day:04d}", 0)
+        base = recorder_sum_before[day] if sums.needs_base(start) else 0.0
+        sums.seed(day_points(day), base)
+
+    rows, adjustments = sums.splice(day_points(100))
+
+    assert rows[0] == (2400, 1.0, 2401.0)
+    assert rows[-1] == (2423, 1.0, 2424.0)
+    assert adjustments == [(2424, 24.0)]
+
+
+def test_sums_are_persisted_in_data():
+    """the buckets are kept in the dict given, a new instance resumes"""
+    data = {}
+    make_sums(data).splice(day_points(0))
+
+    rows, _ = make_sums(data).splice(day_points(1))
+
+    assert rows[0] == (24, 1.0, 25.0)